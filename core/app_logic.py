@@ -16,6 +16,7 @@ from pytesseract import Output
 from PySide6.QtCore import QObject, Signal
 from utils.constants import (
     OCR_ENGINE_PILLOW,
+    OCR_MAX_IMAGE_SIDE,
 )
 
 try:
@@ -121,12 +122,21 @@ class AppLogic(QObject):
             return image
 
         # Determine which engine to use
-        engine = self.config_manager.get_app_config().ocr_engine
+        app_config = self.config_manager.get_app_config()
+        engine = app_config.ocr_engine
         # --- Default Pillow-based preprocessing ---
         self.log_message.emit("Using standard Pillow image preprocessing.")
         processed = image.convert("L")
         max_side = max(processed.size)
-        if max_side < 1600:
+        if app_config.ocr_downscale_large and max_side > OCR_MAX_IMAGE_SIDE:
+            # Tesseract time grows with pixel count; text stays legible well below this size
+            scale = OCR_MAX_IMAGE_SIDE / max_side
+            processed = processed.resize(
+                (max(1, round(processed.width * scale)), max(1, round(processed.height * scale))),
+                Image.Resampling.BILINEAR,
+                reducing_gap=2.0,
+            )
+        elif max_side < 1600:
             scale = 2
             processed = processed.resize((processed.width * scale, processed.height * scale), Image.Resampling.LANCZOS)
         processed = ImageOps.autocontrast(processed)
@@ -136,8 +146,12 @@ class AppLogic(QObject):
         processed = processed.point(lambda p: 255 if p > threshold else 0)
         return processed
 
-    def _perform_ocr_with_boxes(self, image: "Image.Image", language: str = "ja") -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    def _perform_ocr_with_boxes(
+        self, image: "Image.Image", language: str = "ja", source: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
         start_time = time.time()
+        # Batch OCR runs images concurrently, so tag per-image lines with their file
+        label = f"[{source}] " if source else ""
         if not is_pytesseract_installed:
             self.log_message.emit(self.tr("pytesseract_not_installed"))
             return None, None
@@ -149,7 +163,7 @@ class AppLogic(QObject):
 
         try:
             processed = self._preprocess_for_ocr(image)
-            self.log_message.emit(f"Image for Tesseract OCR (Boxes) - size: {processed.size}, mode: {processed.mode}")
+            self.log_message.emit(f"{label}Image for Tesseract OCR (Boxes) - size: {processed.size}, mode: {processed.mode}")
             custom_config = "--oem 3 --psm 6"
 
             if language == "zh-CN":
@@ -172,27 +186,28 @@ class AppLogic(QObject):
             )
 
             end_time = time.time()
-            self.log_message.emit(f"OCR process (with boxes) took {end_time - start_time:.2f} seconds.")
-            self.log_message.emit(f"OCR Raw Text:\n{ocr_text.strip()}")
+            self.log_message.emit(f"{label}OCR process (with boxes) took {end_time - start_time:.2f} seconds.")
+            self.log_message.emit(f"{label}OCR Raw Text:\n{ocr_text.strip()}")
             return ocr_text, data
 
         except pytesseract.TesseractError as te:
             self.ocr_error.emit(self.tr("ocr_error_title"), self.tr("ocr_lang_data_error", te))
-            self.log_message.emit(self.tr("ocr_lang_data_error_log", te))
+            self.log_message.emit(label + self.tr("ocr_lang_data_error_log", te))
         except FileNotFoundError as fnf:
             self.ocr_error.emit(self.tr("ocr_error_title"), self.tr("tesseract_exec_not_found", fnf))
-            self.log_message.emit(self.tr("tesseract_exec_error_log", fnf))
+            self.log_message.emit(label + self.tr("tesseract_exec_error_log", fnf))
         except Exception as ocr_error:
             self.ocr_error.emit(self.tr("ocr_error_title"), self.tr("ocr_process_error", ocr_error))
-            self.log_message.emit(self.tr("ocr_process_error_log", ocr_error))
+            self.log_message.emit(label + self.tr("ocr_process_error_log", ocr_error))
         
         return None, None
 
-    def perform_ocr_workflow(self, image: "Image.Image", language: str) -> OCRResult:
+    def perform_ocr_workflow(self, image: "Image.Image", language: str, source: Optional[str] = None) -> OCRResult:
         """
         Performs the full OCR workflow including bounding boxes.
+        source names the image in log lines (e.g. its file path in a batch).
         """
-        raw_text, data = self._perform_ocr_with_boxes(image, language)
+        raw_text, data = self._perform_ocr_with_boxes(image, language, source)
         if raw_text and data:
             return self.ocr_parser.parse_with_boxes(raw_text, data, language)
         return self.ocr_parser.parse(raw_text or "", language)
@@ -1,11 +1,15 @@
+import sys
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from PIL import Image
 
+# Drop the per-instance __dict__ where dataclasses support it (Python 3.10+)
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class SubStat:
     """Represents a single substat with its name and raw value."""
 
@@ -14,7 +18,7 @@ class SubStat:
     box: Optional[Tuple[int, int, int, int]] = None # (x, y, w, h)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class OCRResult:
     """Container for the results of an OCR operation on a single image."""
 
@@ -24,19 +28,22 @@ class OCRResult:
     main_stat: Optional[str]
     raw_text: str
     boxes: Dict[str, Tuple[int, int, int, int]] = field(default_factory=dict) # General boxes (Main, Cost etc)
+    # Attached by ImageProcessor.run_ocr for preview/storage; declared so slotted instances accept them
+    original_image: Optional["Image.Image"] = None
+    cropped_image: Optional["Image.Image"] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BatchItemResult:
     """Data structure for passing OCR results from worker thread to UI."""
 
     file_path: str
     result: OCRResult
-    original_image: "Image.Image"
+    original_image: Optional["Image.Image"]  # None when only the crop is kept
     cropped_image: "Image.Image"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CropConfig:
     """Container for image cropping parameters."""
 
@@ -47,7 +54,7 @@ class CropConfig:
     height_p: float
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EvaluationResult:
     """Structure for the output of an Echo score evaluation."""
 
@@ -64,7 +71,17 @@ class EvaluationResult:
     current_sub_score: float = 0.0  # Current absolute sub score points
     ideal_substats_list: List[str] = field(default_factory=list) # Top 5 ideal substats
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
+class EchoEvalContext:
+    """Character profile inputs to an echo evaluation, resolved once per calculation."""
+
+    stat_offsets: Dict[str, float] = field(default_factory=dict)
+    base_stats: Dict[str, float] = field(default_factory=dict)
+    ideal_stats: Dict[str, float] = field(default_factory=dict)
+    scaling_stat: str = "攻撃力"
+
+@dataclass(**_SLOTS)
 class TabImageData:
     """Stored image data for a specific tab."""
 
@@ -72,14 +89,14 @@ class TabImageData:
     cropped: "Image.Image"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TabResultData:
     """Stored HTML result for a specific tab."""
 
     content: str
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EchoEntry:
     """Represents the extracted data of an Echo from the UI."""
 
@@ -89,7 +106,7 @@ class EchoEntry:
     substats: List[SubStat] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class HistoryEntry:
     """Represents a single record in the application history."""
 
@@ -102,7 +119,7 @@ class HistoryEntry:
     details: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CharacterProfile:
     """Full settings profile for a character."""
 
@@ -1,6 +1,27 @@
-import re
 import argparse
-from logger import logger
+import os
+import shutil
+import tempfile
+from utils.logger import logger
+
+
+def _is_metadata_line(line: str) -> bool:
+    """行頭の空白を除いた先頭が、1文字以上の数字に続く '|' なら True を返します。"""
+    digits, sep, _ = line.lstrip().partition("|")
+    return bool(sep) and digits.isdecimal()
+
+
+def _rewrite_without_metadata(filepath):
+    """メタデータ行を除いた内容を同じディレクトリの一時ファイルへ書き出し、元のファイルと置き換えます。"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(filepath)), suffix=".tmp")
+    try:
+        with open(filepath, "r", encoding="utf-8") as src, open(fd, "w", encoding="utf-8") as dst:
+            dst.writelines(line for line in src if not _is_metadata_line(line))
+        shutil.copymode(filepath, tmp_path)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
 
 
 def detect_metadata_lines(filepath, fix_file=False):
@@ -8,27 +29,19 @@ def detect_metadata_lines(filepath, fix_file=False):
     指定されたファイル内で、行頭に '数字|' のパターンを持つ行を検出します。
     fix_fileがTrueの場合、これらの行を削除してファイルを上書き保存します。
     """
-    pattern = re.compile(r"^\s*\d+\|\s*.*")
-
-    original_lines = []
-    cleaned_lines = []
     found_errors = False
 
     try:
+        # 行は読みながら判定し、ファイル全体をリストに展開しない
         with open(filepath, "r", encoding="utf-8") as f:
-            original_lines = f.readlines()
-
-        for line_num, line in enumerate(original_lines, 1):
-            if pattern.match(line):
-                logger.info(f"Metadata pattern found at line {line_num}: {line.strip()}")
-                found_errors = True
-            else:
-                cleaned_lines.append(line)  # メタデータがない行は保持
+            for line_num, line in enumerate(f, 1):
+                if _is_metadata_line(line):
+                    logger.info(f"Metadata pattern found at line {line_num}: {line.strip()}")
+                    found_errors = True
 
         if fix_file and found_errors:
             logger.info(f"Fixing {filepath} by removing metadata lines...")
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.writelines(cleaned_lines)
+            _rewrite_without_metadata(filepath)
             logger.info(f"Successfully cleaned {filepath}.")
         elif not found_errors:
             logger.info(f"No metadata patterns found in {filepath}.")
@@ -8,7 +8,9 @@ and performing various scoring evaluations.
 from __future__ import annotations
 
 import hashlib
-from typing import Dict, Any, Optional, List, Tuple
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, Optional, List, Tuple
 
 from utils.constants import (
     STAT_CRIT_RATE,
@@ -28,9 +30,73 @@ from utils.constants import (
     CV_KEY_ER,
     CV_KEY_DMG_BONUS,
     DAMAGE_BONUS_STATS,
+    STAT_BASIC_DMG_BONUS,
+    STAT_ELEMENT_DMG_PLACEHOLDER,
+    DMG_BONUS_SUFFIX,
 )
 from core.data_contracts import EvaluationResult
-from core.scoring import SCORING_METHODS, get_scoring_method
+from core.scoring import (
+    ALL_METHODS_MASK,
+    get_enabled_methods,
+    get_scoring_method,
+    methods_to_mask,
+)
+
+
+@lru_cache(maxsize=None)
+def _is_dmg_bonus_stat(stat_name: str) -> bool:
+    """Return True if stat_name is a DMG bonus stat (memoized per distinct name)."""
+    return DMG_BONUS_SUFFIX in stat_name
+
+
+# Ascending (C, B, A, S, SS, SSS) lower bounds per cost; cost 3 is harder to optimize
+_ACHIEVEMENT_RATING_KEYS = (
+    "rating_c_single",
+    "rating_b_single",
+    "rating_a_single",
+    "rating_s_single",
+    "rating_ss_single",
+    "rating_sss_single",
+)
+_ACHIEVEMENT_THRESHOLDS = {
+    "3": (15, 25, 45, 65, 80),
+    "4": (15, 30, 50, 70, 85),
+}
+_ACHIEVEMENT_THRESHOLDS_DEFAULT = (15, 35, 55, 75, 90)
+
+
+def _collect_main_stat_targets(
+    expected_main_stats: Dict[str, Any]
+) -> Tuple[Dict[str, FrozenSet[str]], Dict[str, str]]:
+    """Group expected main stats by cost prefix ('3_1', '3_2' -> '3')."""
+    grouped: Dict[str, Dict[str, None]] = {}
+    for k, v in expected_main_stats.items():
+        targets = grouped.setdefault(str(k).split("_")[0], {})
+        if isinstance(v, (list, tuple)):
+            for x in v:
+                if isinstance(x, (str, int, float)):
+                    targets[str(x)] = None
+        elif isinstance(v, (str, int, float)):
+            targets[str(v)] = None
+        # Ignore dicts or other unhashable types to prevent crash
+
+    targets_by_cost = {cost: frozenset(t) for cost, t in grouped.items() if t}
+    target_strs = {cost: " / ".join(t) for cost, t in grouped.items() if t}
+    return targets_by_cost, target_strs
+
+
+def precompute_main_stat_targets(config_bundle: Dict[str, Any]) -> None:
+    """
+    Cache per-cost main stat targets in config_bundle.
+
+    Call once after setting "character_main_stats" so evaluate_comprehensive
+    can look targets up instead of rebuilding them for every echo.
+    """
+    targets_by_cost, target_strs = _collect_main_stat_targets(
+        config_bundle.get("character_main_stats", {})
+    )
+    config_bundle["_possible_targets_by_cost"] = targets_by_cost
+    config_bundle["_possible_targets_str_by_cost"] = target_strs
 
 
 class EchoData:
@@ -38,6 +104,11 @@ class EchoData:
     Represents an individual Echo and provides methods for comprehensive scoring.
     """
 
+    # Fixed attribute layout: batch evaluations create many short-lived instances
+    __slots__ = (
+        "cost", "main_stat", "substats", "_level", "level_scale", "score", "rating", "effective_stats_count"
+    )
+
     def __init__(self, cost: int | str, main_stat: str, substats: Dict[str, float]):
         """
         Initialize an Echo instance.
@@ -55,6 +126,17 @@ class EchoData:
         self.rating = ""
         self.effective_stats_count = 0
 
+    @property
+    def level(self) -> int:
+        """Echo level (0-25)."""
+        return self._level
+
+    @level.setter
+    def level(self, value: int) -> None:
+        # Scoring methods scale by level / 25; keep the ratio in sync here
+        self._level = value
+        self.level_scale = value / 25.0
+
     # --- Scoring Methods ---
 
     def calculate_score_normalized(
@@ -145,31 +227,34 @@ class EchoData:
         self,
         character_weights: Dict[str, float],
         config_bundle: Dict[str, Any],
-        enabled_methods: Optional[Dict[str, bool]] = None,
+        enabled_methods: Optional[Dict[str, bool] | int] = None,
         stat_offsets: Optional[Dict[str, float]] = None,
         base_stats: Optional[Dict[str, float]] = None,
         ideal_stats: Optional[Dict[str, float]] = None,
         scaling_stat: str = "攻撃力",
     ) -> EvaluationResult:
-        """Perform a full evaluation using multiple methodologies and stat estimations."""
+        """
+        Perform a full evaluation using multiple methodologies and stat estimations.
+
+        enabled_methods may be a dict of method flags or a mask from methods_to_mask();
+        callers evaluating many echoes should pass the mask to skip re-encoding.
+        """
         stat_offsets = stat_offsets or {}
         base_stats = base_stats or {}
         ideal_stats = ideal_stats or {}
-        enabled_methods = enabled_methods or {
-            "normalized": True, "ratio": True, "roll": True, "effective": True, "cv": True
-        }
+        if isinstance(enabled_methods, int):
+            methods_mask = enabled_methods
+        else:
+            methods_mask = methods_to_mask(enabled_methods) if enabled_methods else ALL_METHODS_MASK
 
         max_vals = config_bundle.get("substat_max_values", {})
-        main_mult = config_bundle.get("main_stat_multiplier", 15.0)
 
         # 1. Individual Method Scores
         results = {}
-        for strategy in SCORING_METHODS:
-            method_name = strategy.name()
-            if enabled_methods.get(method_name):
-                results[method_name] = strategy.calculate(
-                    self, character_weights, config_bundle
-                )
+        for method_name, strategy in get_enabled_methods(methods_mask):
+            results[method_name] = strategy.calculate(
+                self, character_weights, config_bundle
+            )
 
         # 2. Achievement Rate (Main Metric)
         theo_max, ideal_list = self.calculate_theoretical_max_sub_score(character_weights, max_vals)
@@ -217,33 +302,35 @@ class EchoData:
         is_best = True
         penalty = 1.0
         
-        expected_main_stats = config_bundle.get("character_main_stats", {})
         # Find all valid candidates for this cost (e.g., '3', '3_1', '3_2')
         cost_prefix = str(self.cost).split('_')[0]
-        possible_targets = []
-        for k, v in expected_main_stats.items():
-            if k.startswith(cost_prefix):
-                if isinstance(v, (list, tuple)):
-                    possible_targets.extend([str(x) for x in v if isinstance(x, (str, int, float))])
-                elif isinstance(v, (str, int, float)):
-                    possible_targets.append(str(v))
-                # Ignore dicts or other unhashable types to prevent crash
-        
-        if possible_targets:
+        targets_by_cost = config_bundle.get("_possible_targets_by_cost")
+        target_strs = config_bundle.get("_possible_targets_str_by_cost")
+        if targets_by_cost is None or target_strs is None:
+            targets_by_cost, target_strs = _collect_main_stat_targets(
+                config_bundle.get("character_main_stats", {})
+            )
+        target_set = targets_by_cost.get(cost_prefix)
+
+        if target_set:
             # Check for direct match
-            if self.main_stat in possible_targets:
+            if self.main_stat in target_set:
                 is_best = True
             # Special handling for Element DMG placeholder
-            elif "属性ダメージアップ" in possible_targets and "ダメージアップ" in self.main_stat and self.main_stat != "通常攻撃ダメージアップ":
+            elif (
+                STAT_ELEMENT_DMG_PLACEHOLDER in target_set
+                and _is_dmg_bonus_stat(self.main_stat)
+                and self.main_stat != STAT_BASIC_DMG_BONUS
+            ):
                 is_best = True
             # Handle "Acceptable" cases like ATK% for Cost 3 attackers
-            elif cost_prefix == "3" and self.main_stat == "攻撃力%" and any("ダメージアップ" in t or t == "属性ダメージアップ" for t in possible_targets):
+            elif cost_prefix == "3" and self.main_stat == STAT_ATK_PERCENT and any(map(_is_dmg_bonus_stat, target_set)):
                 is_best = True
                 consistency_msg = "攻撃力%は属性ダメージに次ぐ有力な選択肢です（許容範囲）"
                 penalty = 0.97 # Slight penalty for not being "optimal"
             else:
                 is_best = False
-                target_str = " / ".join(set(possible_targets))
+                target_str = target_strs[cost_prefix]
                 consistency_msg = f"メインステータスが一致しません（理想：{target_str}）"
                 penalty = 0.8
 
@@ -254,9 +341,11 @@ class EchoData:
         ideal_stats = config_bundle.get("ideal_stats", {})
         
         if ideal_stats:
+            ideal_er = ideal_stats.get(STAT_ER)
+            ideal_atk_pct = ideal_stats.get(STAT_ATK_PERCENT)
             # Get current estimated total stats (including echo)
-            curr_crit_rate = estimated_stats.get(STAT_CRIT_RATE, 0)
-            curr_crit_dmg = estimated_stats.get(STAT_CRIT_DMG, 0)
+            curr_crit_rate = estimated.get(STAT_CRIT_RATE, 0)
+            curr_crit_dmg = estimated.get(STAT_CRIT_DMG, 0)
             # CRITICAL: Adjustment for Wuthering Waves (Display - 100%)
             adj_crit_dmg = max(0, curr_crit_dmg - 100.0)
             
@@ -277,12 +366,12 @@ class EchoData:
                     advice_list.append("会心率をもう少し上げると期待値が伸びます")
 
             # 2. Stat sufficiency check
-            if STAT_ER in ideal_stats and STAT_ER in estimated_stats:
-                if estimated_stats[STAT_ER] < ideal_stats[STAT_ER] * 0.9:
-                    advice_list.append(f"{STAT_ER}が足りていません（目標: {ideal_stats[STAT_ER]}%）")
+            if ideal_er is not None and STAT_ER in estimated:
+                if estimated[STAT_ER] < ideal_er * 0.9:
+                    advice_list.append(f"{STAT_ER}が足りていません（目標: {ideal_er}%）")
             
-            if STAT_ATK_PERCENT in ideal_stats and STAT_ATK_PERCENT in estimated_stats:
-                if estimated_stats[STAT_ATK_PERCENT] < ideal_stats[STAT_ATK_PERCENT] * 0.8:
+            if ideal_atk_pct is not None and STAT_ATK_PERCENT in estimated:
+                if estimated[STAT_ATK_PERCENT] < ideal_atk_pct * 0.8:
                     advice_list.append(f"{STAT_ATK_PERCENT}を稼ぐとダメージが伸びます")
 
         return EvaluationResult(
@@ -303,25 +392,9 @@ class EchoData:
 
     def get_rating_by_achievement(self, rate: float, cost: str | int) -> str:
         """Determine rating key based on achievement rate and echo cost difficulty."""
-        c = str(cost)
-        if c == "3":
-            # Cost 3 is harder to optimize
-            if rate >= 80: return "rating_sss_single"
-            if rate >= 65: return "rating_ss_single"
-            if rate >= 45: return "rating_s_single"
-            if rate >= 25: return "rating_a_single"
-        elif c == "4":
-            if rate >= 85: return "rating_sss_single"
-            if rate >= 70: return "rating_ss_single"
-            if rate >= 50: return "rating_s_single"
-            if rate >= 30: return "rating_a_single"
-        else: # Cost 1 or unknown
-            if rate >= 90: return "rating_sss_single"
-            if rate >= 75: return "rating_ss_single"
-            if rate >= 55: return "rating_s_single"
-            if rate >= 35: return "rating_a_single"
-
-        return "rating_b_single" if rate >= 15 else "rating_c_single"
+        # Cost 1 or unknown falls back to the strictest table
+        thresholds = _ACHIEVEMENT_THRESHOLDS.get(str(cost), _ACHIEVEMENT_THRESHOLDS_DEFAULT)
+        return _ACHIEVEMENT_RATING_KEYS[bisect_right(thresholds, rate)]
 
     def get_rating_normalized(self, score: float) -> str:
         """Evaluation for normalized score (Method 1)."""
@@ -365,10 +438,10 @@ class EchoData:
 
     def __str__(self) -> str:
         """Return a string representation of the Echo."""
-        subs = "\n".join([f"  {n}: {v}" for n, v in self.substats.items()])
-        return (
-            f"Cost {self.cost} - Level {self.level}\n"
-            f"Main: {self.main_stat}\n"
-            f"Substats:\n{subs}\n"
-            f"Achievement: {self.score:.2f}%"
-        )
\ No newline at end of file
+        return "\n".join((
+            f"Cost {self.cost} - Level {self.level}",
+            f"Main: {self.main_stat}",
+            "Substats:",
+            *(f"  {n}: {v}" for n, v in self.substats.items()),
+            f"Achievement: {self.score:.2f}%",
+        ))
\ No newline at end of file
@@ -4,8 +4,10 @@ Image Processing and OCR Module (PySide6)
 Provides image loading, cropping, OCR processing, and automatic input.
 """
 
+import hashlib
 import os
-from typing import Any, List, Set
+from collections import OrderedDict
+from typing import Any, List, Optional, Set, Tuple
 
 from PySide6.QtCore import QObject, Signal
 
@@ -16,11 +18,19 @@ try:
 except ImportError:
     is_pil_installed = False
 
-from utils.utils import crop_image_by_percent
+from utils.utils import crop_image_by_percent, open_image
+from utils.constants import OCR_CACHE_MAX_ENTRIES
 from core.data_contracts import BatchItemResult, CropConfig, OCRResult
 from core.worker_thread import OCRWorker
 
 
+def _to_rgb(image: "Image.Image", copy: bool = False) -> "Image.Image":
+    """Return image in RGB mode; convert() copies, so RGB input is only copied on request."""
+    if image.mode == "RGB":
+        return image.copy() if copy else image
+    return image.convert("RGB")
+
+
 class ImageProcessor(QObject):
     """Class responsible for image processing and OCR."""
 
@@ -45,12 +55,16 @@ class ImageProcessor(QObject):
         # Internal state
         self.loaded_image = None
         self.original_image = None
+        self._original_rgb = None  # (source image, RGB view of it) built on first display/attach
         self.manual_crop_rect = None  # (left, top, right, bottom) relative 0.0-1.0
 
         # Batch processing state
         self._batch_assigned_tabs: Set[str] = set()
         self._batch_successful_count = 0
 
+        # Recent OCR texts keyed by (image digest, language), least recently used first
+        self._ocr_cache: "OrderedDict[Tuple[bytes, str, bool], str]" = OrderedDict()
+
     def set_manual_crop_rect(self, rect: tuple) -> None:
         """Set manual crop area (left, top, right, bottom) as 0.0-1.0 ratios."""
         self.manual_crop_rect = rect
@@ -73,7 +87,7 @@ class ImageProcessor(QObject):
                     self.error_occurred.emit("Error", f"File not found:\n{file_path}")
                     return
 
-                image = Image.open(file_path)
+                image = open_image(file_path)
                 self.process_loaded_image(image, file_path)
             else:
                 # Multiple images
@@ -130,9 +144,18 @@ class ImageProcessor(QObject):
         if self.config_manager.get_app_config().auto_calculate:
             self.calculation_requested.emit()
 
+    def _get_original_rgb(self) -> "Image.Image":
+        """RGB version of original_image for display and attachment, converted at most once per image."""
+        cached = self._original_rgb
+        if cached is None or cached[0] is not self.original_image:
+            cached = (self.original_image, _to_rgb(self.original_image))
+            self._original_rgb = cached
+        return cached[1]
+
     def process_loaded_image(self, image: "Image.Image", file_path: str = None) -> None:
         """Process a single loaded PIL Image."""
-        self.original_image = image.convert("RGB")
+        # Kept in its source mode; crops are converted to RGB, the full image only when displayed or attached
+        self.original_image = image
         self.log_requested.emit(f"Image loaded: {file_path if file_path else 'Memory'}")
         
         # Reset manual crop on new image
@@ -164,19 +187,33 @@ class ImageProcessor(QObject):
         if mime_data.hasImage():
             qimage = clipboard.image()
             if not qimage.isNull():
-                # Convert QImage to PIL
-                # In PySide6, QImage.bits() returns a memoryview or similar
-                # For PySide6, we can use ImageQt or other methods,
-                # but to keep it simple and consistent:
-                from PIL import ImageQt
-
-                image = ImageQt.fromqimage(qimage)
+                image = self._qimage_to_pil(qimage)
                 self.log_requested.emit("Image pasted from clipboard (QImage).")
                 self.process_loaded_image(image, "Clipboard (Qt)")
                 return
 
         self.log_requested.emit("No image found in clipboard.")
 
+    def _qimage_to_pil(self, qimage: Any) -> "Image.Image":
+        """Convert a QImage to an RGB PIL image with a single buffer copy."""
+        try:
+            from PySide6.QtGui import QImage
+
+            # The pipeline works in RGB; Qt's RGB888 layout matches PIL's "RGB" raw mode
+            if qimage.format() != QImage.Format.Format_RGB888:
+                qimage = qimage.convertToFormat(QImage.Format.Format_RGB888)
+            return Image.frombytes(
+                "RGB",
+                (qimage.width(), qimage.height()),
+                qimage.constBits(),
+                "raw",
+                "RGB",
+                qimage.bytesPerLine(),
+            )
+        except Exception as e:
+            self.log_requested.emit(f"Direct QImage conversion failed, using ImageQt: {e}")
+            return ImageQt.fromqimage(qimage)
+
     def perform_crop(self) -> None:
         """Perform cropping based on current settings and trigger OCR."""
         if self.original_image is None:
@@ -201,14 +238,14 @@ class ImageProcessor(QObject):
                     bottom = max(0, min(h, bottom))
                     
                     if right > left and bottom > top:
-                        self.loaded_image = self.original_image.crop((left, top, right, bottom))
+                        self.loaded_image = _to_rgb(self.original_image.crop((left, top, right, bottom)))
                         self.image_updated.emit(self.loaded_image)
-                        self.run_ocr()
+                        self.run_ocr(app_config)
                     else:
                         self.log_requested.emit("Invalid crop area.")
                 else:
                     # If no crop set, show original mainly for selection
-                    self.loaded_image = self.original_image.copy()
+                    self.loaded_image = _to_rgb(self.original_image, copy=True)
                     self.image_updated.emit(self.loaded_image)
                     self.log_requested.emit("Drag mode: Please select an area to crop.")
                 
@@ -216,36 +253,47 @@ class ImageProcessor(QObject):
                 return
 
             # Perform percent crop
-            self.loaded_image = crop_image_by_percent(
+            self.loaded_image = _to_rgb(crop_image_by_percent(
                 self.original_image,
                 app_config.crop_left_percent,
                 app_config.crop_top_percent,
                 app_config.crop_width_percent,
                 app_config.crop_height_percent,
-            )
+            ))
 
             self.image_updated.emit(self.loaded_image)
-            self.run_ocr()
+            self.run_ocr(app_config)
 
         except Exception as e:
             self.log_requested.emit(f"Crop error: {e}")
 
-    def run_ocr(self) -> None:
-        """Run OCR on the currently loaded (cropped) image."""
+    def run_ocr(self, app_config: Any = None) -> None:
+        """Run OCR on the currently loaded (cropped) image, reusing the caller's app_config if given."""
         if self.loaded_image is None:
             return
 
-        app_config = self.config_manager.get_app_config()
+        if app_config is None:
+            app_config = self.config_manager.get_app_config()
         self.log_requested.emit("Running OCR...")
 
         try:
-            # Perform OCR (AppLogic handles the heavy lifting)
-            ocr_text = self.logic._perform_ocr(self.loaded_image, app_config.language)
+            # Perform OCR (AppLogic handles the heavy lifting) unless this crop was just read
+            cache_key = self._ocr_cache_key(self.loaded_image, app_config.language, app_config.ocr_downscale_large)
+            ocr_text = self._ocr_cache.get(cache_key) if cache_key else None
+            if ocr_text is not None:
+                self._ocr_cache.move_to_end(cache_key)
+                self.log_requested.emit("Reusing OCR result for identical image.")
+            else:
+                ocr_text = self.logic._perform_ocr(self.loaded_image, app_config.language)
+                if cache_key and ocr_text:
+                    self._ocr_cache[cache_key] = ocr_text
+                    if len(self._ocr_cache) > OCR_CACHE_MAX_ENTRIES:
+                        self._ocr_cache.popitem(last=False)
 
             if ocr_text:
                 result = self.logic._parse_ocr_text(ocr_text)
                 # Attach images for preview/storage
-                result.original_image = self.original_image
+                result.original_image = self._get_original_rgb()
                 result.cropped_image = self.loaded_image
 
                 self.ocr_completed.emit(result)
@@ -257,13 +305,26 @@ class ImageProcessor(QObject):
                 self.log_requested.emit("OCR failed: No text detected.")
                 # Even if OCR fails, we might want to store the image
                 result = OCRResult(substats=[], log_messages=[], cost=None, main_stat=None, raw_text="")
-                result.original_image = self.original_image
+                result.original_image = self._get_original_rgb()
                 result.cropped_image = self.loaded_image
                 self.ocr_completed.emit(result)
 
         except Exception as e:
             self.log_requested.emit(f"OCR Execution Error: {e}")
 
+    @staticmethod
+    def _ocr_cache_key(image: Any, language: str, downscale_large: bool) -> Optional[Tuple[bytes, str, bool]]:
+        """Hash the image pixels, size and mode; returns None if the image cannot be hashed.
+
+        downscale_large changes the image Tesseract reads, so results under each setting are kept apart.
+        """
+        try:
+            digest = hashlib.blake2b(image.tobytes(), digest_size=16)
+            digest.update(f"{image.mode}:{image.size}".encode())
+        except Exception:
+            return None
+        return digest.digest(), language, bool(downscale_large)
+
     def perform_crop_preview(self) -> None:
         """Generate a preview of the crop without running OCR."""
         if self.original_image is None:
@@ -271,8 +332,9 @@ class ImageProcessor(QObject):
 
         app_config = self.config_manager.get_app_config()
         try:
+            # ImageQt cannot display modes such as LA, CMYK, I or F
             preview = crop_image_by_percent(
-                self.original_image,
+                self._get_original_rgb(),
                 app_config.crop_left_percent,
                 app_config.crop_top_percent,
                 app_config.crop_width_percent,
@@ -287,4 +349,4 @@ class ImageProcessor(QObject):
         if self.loaded_image:
             self.image_updated.emit(self.loaded_image)
         elif self.original_image:
-            self.image_updated.emit(self.original_image)
+            self.image_updated.emit(self._get_original_rgb())
@@ -6,15 +6,52 @@ Responsible for extracting structured data from raw OCR text.
 
 import re
 import logging
+from bisect import bisect_left
+from itertools import islice
 from typing import List, Tuple, Optional, Any, Dict
 from core.data_contracts import SubStat, OCRResult
 
+# Precompiled patterns shared by all parser instances
+_PCT_RE = re.compile(r"(\d)\s*%")
+_LINE_STAT_RE = re.compile(r"(.+?)\s+([\d\.]*\d[\d\.]*(?:\s*[%％])?)")
+_NUM_RE = re.compile(r"[\d\.]*\d[\d\.]*")
+_COST_RE = re.compile(r"(?:COST|Cost|cost|コスト)[\s:.]*([134])")
+
+# Leading bullet characters OCR emits before stat lines
+_MAIN_BULLETS = "・.:*"
+_SUB_BULLETS = "・."
+
+
+def _compile_needles(needles: Any) -> "re.Pattern[str]":
+    """Compiles needles into one alternation, so a line holding none of them is rejected in a single C-level scan."""
+    ordered = sorted(set(needles), key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, ordered)) if ordered else r"(?!)")
+
+
+def _normalize_line(line: str) -> str:
+    """Collapse whitespace runs and glue '12 %' into '12%' in a bullet-stripped line."""
+    line = " ".join(line.split())
+    # After collapsing, a digit/percent gap can only be a single space
+    if " %" in line:
+        line = _PCT_RE.sub(r"\1%", line)
+    return line
+
 
 class OcrParser:
     def __init__(self, data_manager: Any, tr_func: Any):
         self.data_manager = data_manager
         self.tr = tr_func
         self.logger = logging.getLogger(__name__)
+        self._alias_lookup: Dict[str, str] = {}
+        self._alias_scan: Tuple[Tuple[str, str], ...] = ()
+        self._alias_scan_neg_lengths: List[int] = []
+        self._alias_scan_re: "re.Pattern[str]" = _compile_needles(())
+        self._alias_lookup_source: Optional[List[Tuple[str, str]]] = None
+        self._main_stat_matchers: Dict[Optional[str], Tuple[Tuple[str, Tuple[str, ...]], ...]] = {}
+        self._main_stat_prefilters: Dict[Optional[str], "re.Pattern[str]"] = {}
+        self._main_stat_matchers_source: Optional[Tuple[Any, Any]] = None
+        self._substat_lookup: Dict[str, Tuple[str, float]] = {}
+        self._substat_lookup_source: Optional[Dict[str, float]] = None
 
     def parse(self, raw_text: str, language: str) -> OCRResult:
         """
@@ -103,107 +140,167 @@ class OcrParser:
         if not ocr_text:
             return None
 
-        possible_stats = []
-        if cost and cost in self.data_manager.main_stat_options:
-            possible_stats = self.data_manager.main_stat_options[cost]
-        else:
-            for stats in self.data_manager.main_stat_options.values():
-                possible_stats.extend(stats)
-            possible_stats = list(set(possible_stats))
-
-        stat_aliases = self.data_manager.stat_aliases
+        matchers, prefilter = self._get_main_stat_matchers(cost)
 
-        cleaned_lines = []
+        # Only the first 10 non-empty lines are searched; stop cleaning there
+        search_lines = []
         for line in ocr_text.splitlines():
             line_clean = line.strip()
             if not line_clean:
                 continue
-            line_clean = re.sub(r"^\s*[\・\.\:\*]\s*", "", line_clean)
-            line_clean = re.sub(r"\s+", " ", line_clean)
-            line_clean = re.sub(r"(\d)\s*%", r"\1%", line_clean)
-            cleaned_lines.append(line_clean)
-
-        search_limit = min(len(cleaned_lines), 10)
-        search_lines = cleaned_lines[:search_limit]
+            if line_clean[0] in _MAIN_BULLETS:
+                line_clean = line_clean[1:]
+            search_lines.append(_normalize_line(line_clean))
+            if len(search_lines) >= 10:
+                break
 
         for line in search_lines:
-            for stat in possible_stats:
-                if stat in line:
-                    return stat
-
-                aliases = stat_aliases.get(stat, [])
-                for alias in aliases:
-                    if alias in line:
+            # Priority order decides the stat, so the regex only rules lines out
+            if not prefilter.search(line):
+                continue
+            for stat, needles in matchers:
+                for needle in needles:
+                    if needle in line:
                         return stat
+        return None
+
+    def _get_main_stat_matchers(
+        self, cost: Optional[str]
+    ) -> Tuple[Tuple[Tuple[str, Tuple[str, ...]], ...], "re.Pattern[str]"]:
+        """
+        Returns (stat, needles) pairs for main stat detection, in priority order,
+        and a pattern matching any of the needles.
 
+        Needles are the stat name, its aliases and, for percent stats, the bare name.
+        Tables are built once per cost and rebuilt only if the game data is replaced.
+        """
+        options = self.data_manager.main_stat_options
+        stat_aliases = self.data_manager.stat_aliases
+        source = self._main_stat_matchers_source
+        if source is None or source[0] is not options or source[1] is not stat_aliases:
+            self._main_stat_matchers = {}
+            self._main_stat_prefilters = {}
+            self._main_stat_matchers_source = (options, stat_aliases)
+
+        key = cost if cost and cost in options else None
+        matchers = self._main_stat_matchers.get(key)
+        if matchers is None:
+            if key is not None:
+                possible_stats = options[key]
+            else:
+                possible_stats = list(dict.fromkeys(stat for stats in options.values() for stat in stats))
+
+            built = []
+            for stat in possible_stats:
+                needles = [stat, *stat_aliases.get(stat, [])]
                 if stat.endswith("%"):
-                    base_name = stat.rstrip("%")
-                    if base_name in line:
-                        return stat
-        return None
+                    needles.append(stat.rstrip("%"))
+                built.append((stat, tuple(dict.fromkeys(needles))))
+            matchers = tuple(built)
+            self._main_stat_matchers[key] = matchers
+            self._main_stat_prefilters[key] = _compile_needles(n for _, needles in matchers for n in needles)
+        return matchers, self._main_stat_prefilters[key]
 
     def parse_substats(self, ocr_text: str, language: str) -> Tuple[List[SubStat], List[str]]:
         """Parses substats from OCR text."""
         if not ocr_text or not ocr_text.strip():
             return [], []
 
-        cleaned_lines = []
-        for line in ocr_text.strip().splitlines():
-            if not line.strip():
-                continue
-            cleaned_line = re.sub(r"^\s*[\・\.]*\s*", "", line.strip())
-            cleaned_line = re.sub(r"\s+", " ", cleaned_line)
-            cleaned_line = re.sub(r"(\d)\s*%", r"\1%", cleaned_line)
-            cleaned_lines.append(cleaned_line.strip())
-
-        lines = cleaned_lines
-        last_five = lines[-5:] if len(lines) >= 5 else lines
+        # Substats are the last five non-empty lines; only those need cleaning
+        lines = [line.strip() for line in ocr_text.strip().splitlines() if line.strip()]
+        last_five = [_normalize_line(line.lstrip(_SUB_BULLETS)) for line in lines[-5:]]
         alias_pairs = self.data_manager.get_alias_pairs()
 
         found_substats = []
         log_messages = []
+        tr = self.tr
 
         for i, line in enumerate(last_five):
             result = self._parse_single_line(line, alias_pairs)
             if result:
                 substat, is_percent = result
                 found_substats.append(substat)
-                stat_name_for_log = self.tr(substat.stat)
+                stat_name_for_log = tr(substat.stat)
                 log_messages.append(
                     f"OCR auto-fill: Sub{i + 1} -> {stat_name_for_log} {substat.value}{'%' if is_percent else ''}"
                 )
 
         return found_substats, log_messages
 
+    def _get_alias_lookup(self, alias_pairs: List[Tuple[str, str]]) -> Dict[str, str]:
+        """
+        Returns an exact-match map of stat names and aliases to stat names.
+
+        Built once per alias_pairs list; the first matching pair wins, as in a linear scan.
+        The substring-scan table (longest alias first) is rebuilt alongside it.
+        """
+        if self._alias_lookup_source is not alias_pairs:
+            lookup: Dict[str, str] = {}
+            for stat, alias in alias_pairs:
+                lookup.setdefault(stat, stat)
+                lookup.setdefault(alias, stat)
+            self._alias_lookup = lookup
+            # Stable sort: pairs already ordered longest-first keep their order
+            self._alias_scan = tuple(sorted(alias_pairs, key=lambda pair: -len(pair[1])))
+            self._alias_scan_neg_lengths = [-len(alias) for _, alias in self._alias_scan]
+            self._alias_scan_re = _compile_needles(alias for _, alias in self._alias_scan)
+            self._alias_lookup_source = alias_pairs
+        return self._alias_lookup
+
+    def _scan_aliases(self, line: str) -> Optional[str]:
+        """Returns the stat of the longest alias contained in line (call _get_alias_lookup first)."""
+        if not self._alias_scan_re.search(line):
+            return None
+        # Aliases longer than the line cannot match; skip straight past them
+        start = bisect_left(self._alias_scan_neg_lengths, -len(line))
+        for stat, alias in islice(self._alias_scan, start, None):
+            if alias in line:
+                return stat
+        return None
+
+    def _get_substat_lookup(self) -> Dict[str, Tuple[str, float]]:
+        """
+        Returns a map of stat names to (max-value key, max value).
+
+        A bare name also resolves to its '%' entry when it has no entry of its own.
+        Rebuilt only if the game data's max-value table is replaced.
+        """
+        max_values = self.data_manager.substat_max_values
+        if self._substat_lookup_source is not max_values:
+            lookup = {name: (name, value) for name, value in max_values.items()}
+            for name, value in max_values.items():
+                if name.endswith("%"):
+                    lookup.setdefault(name[:-1], (name, value))
+            self._substat_lookup = lookup
+            self._substat_lookup_source = max_values
+        return self._substat_lookup
+
     def _parse_single_line(self, line: str, alias_pairs: List[Tuple[str, str]]) -> Optional[Tuple[SubStat, bool]]:
         stat_found = ""
         num_found = ""
         is_percent = False
+        alias_lookup = self._get_alias_lookup(alias_pairs)
 
-        match = re.search(r"(.+?)\s+([\d\.]*\d[\d\.]*(?:\s*[%％])?)", line)
+        match = _LINE_STAT_RE.search(line)
         if match:
             stat_text_from_line = match.group(1).strip()
             num_text_from_line = match.group(2).strip()
-            for stat, alias in alias_pairs:
-                if stat_text_from_line == stat or stat_text_from_line == alias:
-                    stat_found = stat
-                    nums = re.findall(r"[\d\.]*\d[\d\.]*", num_text_from_line.replace("％", "%"))
-                    if nums:
-                        num_found = nums[0]
-                        if "%" in num_text_from_line or "％" in num_text_from_line:
-                            is_percent = True
-                    break
+            stat_found = alias_lookup.get(stat_text_from_line, "")
+            if stat_found:
+                nums = _NUM_RE.findall(num_text_from_line.replace("％", "%"))
+                if nums:
+                    num_found = nums[0]
+                    if "%" in num_text_from_line or "％" in num_text_from_line:
+                        is_percent = True
 
         if not stat_found:
-            for stat, alias in alias_pairs:
-                if alias in line:
-                    stat_found = stat
-                    nums = re.findall(r"[\d\.]*\d[\d\.]*", line.replace("％", "%"))
-                    if nums:
-                        num_found = nums[0]
-                        if "%" in line or "％" in line:
-                            is_percent = True
-                    break
+            stat_found = self._scan_aliases(line) or ""
+            if stat_found:
+                nums = _NUM_RE.findall(line.replace("％", "%"))
+                if nums:
+                    num_found = nums[0]
+                    if "%" in line or "％" in line:
+                        is_percent = True
 
         if stat_found and num_found:
             corrected_stat, corrected_val, was_percent = self.validate_and_correct_substat(
@@ -218,8 +315,7 @@ class OcrParser:
         except ValueError:
             return stat_name, raw_value, is_percent
 
-        search_name = stat_name if stat_name in self.data_manager.substat_max_values else f"{stat_name}%"
-        max_val = self.data_manager.substat_max_values.get(search_name)
+        _, max_val = self._get_substat_lookup().get(stat_name, (None, None))
         if not max_val:
             return stat_name, raw_value, is_percent
 
@@ -242,15 +338,20 @@ class OcrParser:
     def detect_cost(self, ocr_text: str) -> Optional[str]:
         if not ocr_text:
             return None
-        lines = [line.strip() for line in ocr_text.splitlines() if line.strip()]
-        if not lines:
-            return None
-
-        check_count = min(len(lines), 3)
-        cost_pattern = re.compile(r"(?:COST|Cost|cost|コスト)[\s:.]*([134])")
-        for i in range(check_count):
-            line = lines[i]
-            match = cost_pattern.search(line)
+        # Cost is only looked for in the first three non-empty lines; walk to them without splitting the rest
+        pos = 0
+        end_of_text = len(ocr_text)
+        checked = 0
+        while checked < 3 and pos <= end_of_text:
+            end = ocr_text.find("\n", pos)
+            if end == -1:
+                end = end_of_text
+            line = ocr_text[pos:end]
+            pos = end + 1
+            if not line.strip():
+                continue
+            checked += 1
+            match = _COST_RE.search(line)
             if match:
                 return match.group(1)
         return None
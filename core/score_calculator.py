@@ -7,16 +7,21 @@ and game data.
 
 from __future__ import annotations
 
-from typing import Dict, Any, Optional, TYPE_CHECKING
+from typing import Dict, Any, List, Optional, Tuple, Union, TYPE_CHECKING
 from PySide6.QtCore import QObject, Signal
 
-from core.echo_data import EchoData
-from core.data_contracts import EchoEntry, EvaluationResult
+from core.echo_data import EchoData, precompute_main_stat_targets
+from core.data_contracts import EchoEntry, EchoEvalContext, EvaluationResult
+from core.scoring import METHOD_NAMES, methods_to_mask
+from core.scoring.methods import precompute_stat_coefficients
 from utils.constants import ACTION_SINGLE, ACTION_BATCH
 
 if TYPE_CHECKING:
     from ui.html_renderer import HtmlRenderer
 
+# Characters stripped from substat values before float conversion (OCR/manual noise)
+_SUBSTAT_NOISE_TABLE = str.maketrans("", "", "% +")
+
 
 class ScoreCalculator(QObject):
     """
@@ -76,10 +81,18 @@ class ScoreCalculator(QObject):
             weights = self.character_manager.get_stat_weights(character)
             config_bundle = self._get_config_bundle()
             config_bundle["character_main_stats"] = self.character_manager.get_main_stats(character)
+            precompute_main_stat_targets(config_bundle)
+            precompute_stat_coefficients(config_bundle, weights)
+            methods_mask = methods_to_mask(enabled_methods)
+            eval_context = self._get_eval_context(character)
+            app_config = self.config_manager.get_app_config()
+            # Shared with the equipped-echo evaluation, which is a cache hit when it is the same echo
+            evaluation_cache: Dict[Any, Tuple[str, EvaluationResult]] = {}
 
             evaluation = self._process_echo_evaluation(
-                entry, weights, config_bundle, enabled_methods, 
-                character, ACTION_SINGLE, tab_name
+                entry, weights, config_bundle, methods_mask, 
+                character, ACTION_SINGLE, tab_name, eval_context=eval_context,
+                evaluation_cache=evaluation_cache, app_config=app_config
             )
 
             if evaluation:
@@ -87,8 +100,9 @@ class ScoreCalculator(QObject):
                 equipped = self.character_manager.get_equipped_echo(character, tab_name)
                 if equipped:
                     eq_eval = self._process_echo_evaluation(
-                        equipped, weights, config_bundle, enabled_methods,
-                        character, "INTERNAL", tab_name, record_history=False
+                        equipped, weights, config_bundle, methods_mask,
+                        character, "INTERNAL", tab_name, record_history=False,
+                        eval_context=eval_context, evaluation_cache=evaluation_cache
                     )
                     if eq_eval:
                         evaluation.comparison_diff = (
@@ -132,35 +146,53 @@ class ScoreCalculator(QObject):
             weights = self.character_manager.get_stat_weights(character)
             config_bundle = self._get_config_bundle()
             config_bundle["character_main_stats"] = self.character_manager.get_main_stats(character)
+            precompute_main_stat_targets(config_bundle)
+            precompute_stat_coefficients(config_bundle, weights)
+            methods_mask = methods_to_mask(enabled_methods)
+            eval_context = self._get_eval_context(character)
+            app_config = self.config_manager.get_app_config()
+            lang_dict = self._get_lang_dict(language)
 
             all_evaluations = []
-            total_scores = {"total": 0.0}
+            # Tabs holding the same echo share one evaluation (keyed by parsed stats)
+            evaluation_cache: Dict[Any, Tuple[str, EvaluationResult]] = {}
+            total_scores = {"total": 0.0, "current_sub_score": 0.0}
             
             # Initialize method accumulators
-            for method in ["normalized", "ratio", "roll", "effective", "cv"]:
-                if enabled_methods.get(method, False):
-                    total_scores[method] = 0.0
+            summed_methods = tuple(method for method in METHOD_NAMES if enabled_methods.get(method, False))
+            for method in summed_methods:
+                total_scores[method] = 0.0
 
             calculated_count = 0
-            for tab_name, entry in tabs_data.items():
-                if not entry or not entry.main_stat:
-                    continue
+            # Per-echo log lines go out as one message after the loop
+            log_buffer: List[str] = []
+            # History is written once for the whole batch instead of once per echo
+            with self.history_mgr.deferred_save():
+                for tab_name, entry in tabs_data.items():
+                    if not entry or not entry.main_stat:
+                        continue
+
+                    evaluation = self._process_echo_evaluation(
+                        entry, weights, config_bundle, methods_mask, 
+                        character, ACTION_BATCH, tab_name, eval_context=eval_context,
+                        evaluation_cache=evaluation_cache, app_config=app_config,
+                        log_buffer=log_buffer
+                    )
 
-                evaluation = self._process_echo_evaluation(
-                    entry, weights, config_bundle, enabled_methods, 
-                    character, ACTION_BATCH, tab_name
-                )
+                    if evaluation:
+                        eval_data = self._format_eval_data_for_batch(
+                            tab_name, evaluation, language, lang_dict
+                        )
+                        all_evaluations.append(eval_data)
+                        total_scores["total"] += evaluation.total_score
+                        total_scores["current_sub_score"] += evaluation.current_sub_score
+                        scores = evaluation.individual_scores
+                        for method in summed_methods:
+                            total_scores[method] += scores.get(method, 0.0)
+                        calculated_count += 1
 
-                if evaluation:
-                    eval_data = self._format_eval_data_for_batch(
-                        tab_name, evaluation, language
-                    )
-                    all_evaluations.append(eval_data)
-                    total_scores["total"] += evaluation.total_score
-                    for method, score in evaluation.individual_scores.items():
-                        if method in total_scores:
-                            total_scores[method] += score
-                    calculated_count += 1
+            if log_buffer:
+                self.log_requested.emit("\n".join(log_buffer))
 
             if calculated_count == 0:
                 self.batch_calculation_completed.emit("No data available.\n", character)
@@ -190,30 +222,34 @@ class ScoreCalculator(QObject):
         if not entry or not entry.substats:
             return substats
 
+        tr = self.renderer.tr
+        _float = float
         for sub in entry.substats:
-            if not sub.stat or not sub.value:
+            value = sub.value
+            if not sub.stat or not value:
                 continue
             try:
-                # Clean value of common OCR or manual noise
-                clean_val = (
-                    sub.value.replace("%", "")
-                    .replace(" ", "").replace("+", "").strip()
-                )
-                if not clean_val:
-                    continue
-                
-                val = float(clean_val)
+                try:
+                    # Most values are plain numbers or end in a single '%'
+                    val = _float(value[:-1] if value.endswith("%") else value)
+                except ValueError:
+                    # Clean value of common OCR or manual noise
+                    clean_val = value.translate(_SUBSTAT_NOISE_TABLE).strip()
+                    if not clean_val:
+                        continue
+                    val = _float(clean_val)
+
                 # Safeguard against unreasonable values
                 if not (0 <= val < 1000000):
                      self.log_requested.emit(
-                         f"Value out of range for '{self.renderer.tr(sub.stat)}': '{val}'"
+                         f"Value out of range for '{tr(sub.stat)}': '{val}'"
                      )
                      continue
 
                 substats[sub.stat] = val
             except (ValueError, TypeError):
                 self.log_requested.emit(
-                    f"Invalid numeric value for '{self.renderer.tr(sub.stat)}': '{sub.value}'"
+                    f"Invalid numeric value for '{tr(sub.stat)}': '{sub.value}'"
                 )
                 continue
         return substats
@@ -229,66 +265,102 @@ class ScoreCalculator(QObject):
             "cv_weights": dm.cv_weights,
         }
 
+    def _get_eval_context(self, character: str) -> EchoEvalContext:
+        """Resolve the character profile inputs passed to evaluate_comprehensive."""
+        profile = self.character_manager.get_character_profile(character)
+        if not profile:
+            return EchoEvalContext()
+        return EchoEvalContext(
+            stat_offsets=profile.stat_offsets,
+            base_stats=profile.base_stats,
+            ideal_stats=profile.ideal_stats,
+            scaling_stat=profile.scaling_stat,
+        )
+
     def _process_echo_evaluation(
         self,
         entry: EchoEntry,
         weights: Dict[str, float],
         config_bundle: Dict[str, Any],
-        enabled_methods: Dict[str, bool],
+        enabled_methods: Union[Dict[str, bool], int],
         character: str,
         action_type: str,
         tab_name_for_log: str,
         record_history: bool = True,
+        eval_context: Optional[EchoEvalContext] = None,
+        evaluation_cache: Optional[Dict[Any, Tuple[str, EvaluationResult]]] = None,
+        app_config: Any = None,
+        log_buffer: Optional[List[str]] = None,
     ) -> Optional[EvaluationResult]:
         """
         Internal core logic for evaluating an echo entry.
         
         Calculates score, detects duplicates, and records history.
+        eval_context may be resolved once per batch via _get_eval_context.
+        With evaluation_cache, an echo already evaluated in the same batch reuses
+        its (fingerprint, evaluation) pair; only the scoring is skipped, the
+        duplicate check and history record still happen for every tab.
+        The cache key is built from the parsed substats, so identical echoes hit it
+        before an EchoData is constructed.
+        app_config, if given, is used instead of fetching it for each record.
+        Log lines are appended to log_buffer when given, instead of emitted.
         """
         if not entry.main_stat:
             return None
 
+        log = self.log_requested.emit if log_buffer is None else log_buffer.append
         substats = self.extract_substats_from_entry(entry)
         if record_history:
-            self.log_requested.emit(
+            log(
                 f"Evaluating Echo - Cost: {entry.cost}, Main: "
                 f"{entry.main_stat}, Substats: {substats}"
             )
 
-        echo = EchoData(entry.cost, entry.main_stat, substats)
+        entry_key = None
+        cached = None
+        if evaluation_cache is not None:
+            entry_key = self._entry_cache_key(entry.cost, entry.main_stat, substats)
+            cached = evaluation_cache.get(entry_key)
 
-        # Retrieve character profile for advanced calculation parameters
-        profile = self.character_manager.get_character_profile(character)
-        stat_offsets = profile.stat_offsets if profile else {}
-        base_stats = profile.base_stats if profile else {}
-        ideal_stats = profile.ideal_stats if profile else {}
-        scaling_stat = profile.scaling_stat if profile else "攻撃力"
+        if cached is not None:
+            fingerprint, evaluation = cached
+        else:
+            echo = EchoData(entry.cost, entry.main_stat, substats)
+            # Duplicate detection using history
+            fingerprint = echo.get_fingerprint()
+            evaluation = None
 
-        # Duplicate detection using history
-        fingerprint = echo.get_fingerprint()
         if record_history:
             duplicates = self.history_mgr.find_duplicates(fingerprint)
             if duplicates:
-                self.log_requested.emit(
+                log(
                     f"[{tab_name_for_log}] Duplicate Detected "
                     f"(Previous IDs: {duplicates})"
                 )
 
-        # Core calculation
-        evaluation = echo.evaluate_comprehensive(
-            weights,
-            config_bundle,
-            enabled_methods,
-            stat_offsets=stat_offsets,
-            base_stats=base_stats,
-            ideal_stats=ideal_stats,
-            scaling_stat=scaling_stat,
-        )
+        if evaluation is None:
+            # Retrieve character profile for advanced calculation parameters
+            if eval_context is None:
+                eval_context = self._get_eval_context(character)
+
+            # Core calculation
+            evaluation = echo.evaluate_comprehensive(
+                weights,
+                config_bundle,
+                enabled_methods,
+                stat_offsets=eval_context.stat_offsets,
+                base_stats=eval_context.base_stats,
+                ideal_stats=eval_context.ideal_stats,
+                scaling_stat=eval_context.scaling_stat,
+            )
+            if evaluation_cache is not None:
+                evaluation_cache[entry_key] = (fingerprint, evaluation)
 
         # Record result to history database
         if record_history:
             result_summary = f"Score: {evaluation.total_score:.2f} ({evaluation.rating})"
-            app_config = self.config_manager.get_app_config()
+            if app_config is None:
+                app_config = self.config_manager.get_app_config()
             self.history_mgr.add_entry(
                 character=character,
                 cost=entry.cost or "Unknown",
@@ -304,13 +376,32 @@ class ScoreCalculator(QObject):
 
         return evaluation
 
+    @staticmethod
+    def _entry_cache_key(cost: Any, main_stat: str, substats: Dict[str, float]) -> Tuple[Any, ...]:
+        """Key over the same parsed fields as EchoData.get_fingerprint, without hashing them."""
+        return str(cost), main_stat, tuple(sorted(substats.items()))
+
+    @staticmethod
+    def _get_lang_dict(language: str) -> Dict[str, str]:
+        """Return the translation table for language, falling back to English."""
+        from utils.languages import TRANSLATIONS
+
+        return TRANSLATIONS.get(language, TRANSLATIONS["en"])
+
     def _format_eval_data_for_batch(
-        self, tab_name: str, evaluation: EvaluationResult, language: str
+        self,
+        tab_name: str,
+        evaluation: EvaluationResult,
+        language: str,
+        lang_dict: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
-        """Format an evaluation result for batch rendering display."""
-        from utils.languages import TRANSLATIONS
+        """
+        Format an evaluation result for batch rendering display.
 
-        lang_dict = TRANSLATIONS.get(language, TRANSLATIONS["en"])
+        Batch callers resolve lang_dict once and pass it in.
+        """
+        if lang_dict is None:
+            lang_dict = self._get_lang_dict(language)
 
         eval_data = {
             "tab_name": tab_name,
@@ -1,6 +1,6 @@
 import os
 import logging
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from PIL import Image, ImageDraw, ImageFont
 
 from core.data_contracts import EchoEntry, EvaluationResult
@@ -16,6 +16,22 @@ SCORE_COLOR_A = (255, 165, 0)
 SCORE_COLOR_B = (100, 200, 100)
 SCORE_COLOR_C = (150, 150, 150)
 
+# Font sizes used by the layout: title, average score, card header, main stat, substats, footer
+FONT_SIZES = (80, 40, 32, 28, 24, 22)
+
+# Card grid: 5 columns in 1 row, centred horizontally
+CARD_W, CARD_H = 360, 720
+CARD_MARGIN_X = 20
+CARD_ROW_Y = 250
+_CARD_X_START = (WIDTH - (CARD_W * 5 + CARD_MARGIN_X * 4)) // 2
+CARD_POSITIONS = tuple((_CARD_X_START + i * (CARD_W + CARD_MARGIN_X), CARD_ROW_Y) for i in range(5))
+
+# Encoder settings by output extension: favour fast encoding over the last few KB
+SAVE_OPTIONS = {
+    ".png": {"compress_level": 1, "optimize": False},
+    ".webp": {"quality": 90, "method": 4},
+}
+
 class ScoreboardGenerator:
     # Theme colors for elements
     ELEMENT_THEMES = {
@@ -28,10 +44,23 @@ class ScoreboardGenerator:
     }
     DEFAULT_THEME = {"bg": (30, 30, 30), "accent": (255, 215, 0)}
 
+    # Tier token of a rating key ("rating_<tier>_single") -> (label, score color)
+    RATING_STYLES = {
+        "sss": ("SSS", SCORE_COLOR_S),
+        "ss": ("SS", SCORE_COLOR_S),
+        "s": ("S", SCORE_COLOR_A),
+        "a": ("A", SCORE_COLOR_A),
+        "b": ("B", SCORE_COLOR_B),
+        "c": ("C", SCORE_COLOR_C),
+    }
+    UNKNOWN_RATING_STYLE = ("?", SCORE_COLOR_C)
+
     def __init__(self, logger: logging.Logger = None):
         self.logger = logger or logging.getLogger(__name__)
         self.font_path = self._find_font()
         self._font_cache = {}
+        self._fonts = {size: self._get_font(size) for size in FONT_SIZES}
+        self._rating_styles: Dict[str, Tuple[str, Tuple[int, int, int]]] = {}  # full rating key -> style
 
     def _find_font(self) -> str:
         """Attempts to find a suitable Japanese font."""
@@ -48,17 +77,19 @@ class ScoreboardGenerator:
         return "arial.ttf"
 
     def _get_font(self, size: int) -> ImageFont.FreeTypeFont:
-        """Loads and caches fonts of various sizes."""
+        """Loads and caches fonts of various sizes (including the default-font fallback)."""
         if size in self._font_cache:
             return self._font_cache[size]
+        font = None
         try:
             if self.font_path and os.path.exists(self.font_path):
                 font = ImageFont.truetype(self.font_path, size)
-                self._font_cache[size] = font
-                return font
         except Exception:
             pass
-        return ImageFont.load_default()
+        if font is None:
+            font = ImageFont.load_default()
+        self._font_cache[size] = font
+        return font
 
     def _get_element_colors(self, element: str) -> tuple[tuple[int, int, int], tuple[int, int, int]]:
         """Returns (BG_COLOR, ACCENT_COLOR) for a given element."""
@@ -88,7 +119,8 @@ class ScoreboardGenerator:
             img = Image.new("RGB", (WIDTH, HEIGHT), bg_color)
             draw = ImageDraw.Draw(img)
 
-            title_font = self._get_font(80)
+            title_font = self._fonts[80]
+            info_font = self._fonts[40]
             header_text = f"{tr('echo_build_title', 'Echo Build')}: {character_name}"
             draw.text((50, 50), header_text, font=title_font, fill=TEXT_COLOR)
 
@@ -101,57 +133,53 @@ class ScoreboardGenerator:
             avg_text = f"{tr('average_score_label', 'Average Score')}: {avg_score:.1f}"
             draw.text((50, 150), avg_text, font=info_font, fill=accent_color)
 
-            # Grid layout settings: 5 columns in 1 row
-            card_w, card_h = 360, 720
-            margin_x = 20
-            row_y = 250
-            total_grid_w = (card_w * 5) + (margin_x * 4)
-            x_start = (WIDTH - total_grid_w) // 2
+            # Every card shares the same background; draw it once and paste it per card
+            card_template = Image.new("RGB", (CARD_W + 1, CARD_H + 1), CARD_BG_COLOR)
+            ImageDraw.Draw(card_template).rectangle(
+                [0, 0, CARD_W, CARD_H], fill=CARD_BG_COLOR, outline=(100, 100, 100), width=2
+            )
 
-            for i, entry in enumerate(echo_entries):
-                if i >= 5: break
-                x = x_start + i * (card_w + margin_x)
-                y = row_y
-                self._draw_card(img, x, y, card_w, card_h, entry, scores[i] if i < len(scores) else None, i, echo_images, tr, accent_color)
+            for i, (entry, (x, y)) in enumerate(zip(echo_entries, CARD_POSITIONS)):
+                img.paste(card_template, (x, y))
+                self._draw_card(img, draw, x, y, CARD_W, CARD_H, entry, scores[i] if i < len(scores) else None, i, echo_images, tr, accent_color)
 
-            img.save(output_path)
+            img.save(output_path, **SAVE_OPTIONS.get(os.path.splitext(output_path)[1].lower(), {}))
             return True
         except Exception as e:
             self.logger.exception(f"Scoreboard Error: {e}")
             return False
 
-    def _draw_card(self, canvas, x, y, w, h, entry, score, index, image_map, tr, accent_color):
-        draw = ImageDraw.Draw(canvas)
-        draw.rectangle([x, y, x + w, y + h], fill=CARD_BG_COLOR, outline=(100, 100, 100), width=2)
+    def _draw_card(self, canvas, draw, x, y, w, h, entry, score, index, image_map, tr, accent_color):
+        """Draws one card's contents over its pasted background."""
         px, py = 20, 20
         cx, cy = x + px, y + py
         cw = w - px * 2
 
-        header_font = self._get_font(32)
+        header_font = self._fonts[32]
         draw.text((cx, cy), f"{tr('cost_label_short', 'Cost')} {entry.cost or '?'}", font=header_font, fill=accent_color)
 
         if score:
-            color = {"sss": SCORE_COLOR_S, "ss": SCORE_COLOR_S, "s_": SCORE_COLOR_A, "a_": SCORE_COLOR_A, "b_": SCORE_COLOR_B}.get(score.rating[:2], SCORE_COLOR_C)
-            score_text = f"{score.total_score:.1f} ({self._format_rating(score.rating)})"
+            label, color = self._rating_style(score.rating)
+            score_text = f"{score.total_score:.1f} ({label})"
             bbox = draw.textbbox((0, 0), score_text, font=header_font)
             draw.text((x + w - px - (bbox[2] - bbox[0]), cy), score_text, font=header_font, fill=color)
 
         cy += 50
         if index in image_map and image_map[index]:
             thumb = image_map[index].copy()
-            thumb.thumbnail((cw, 180)) # Slightly taller thumbnail area
+            thumb.thumbnail((cw, 180), Image.Resampling.BILINEAR) # Slightly taller thumbnail area
             canvas.paste(thumb, (x + (w - thumb.width) // 2, cy))
             cy += thumb.height + 20
         else: cy += 20
 
-        main_font = self._get_font(28)
+        main_font = self._fonts[28]
         if entry.main_stat:
             draw.text((cx, cy), f"{tr('main_stat', 'Main')}: {tr(entry.main_stat, entry.main_stat)}", font=main_font, fill=TEXT_COLOR)
         cy += 40
         draw.line([cx, cy, x + w - px, cy], fill=(150, 150, 150), width=1)
         cy += 15
 
-        sub_font = self._get_font(24)
+        sub_font = self._fonts[24]
         for sub in entry.substats:
             draw.text((cx, cy), tr(sub.stat, sub.stat), font=sub_font, fill=(200, 200, 200))
             val_str = sub.value
@@ -160,9 +188,15 @@ class ScoreboardGenerator:
             cy += 32
 
         if score:
-            draw.text((cx, y + h - 50), f"{tr('effective_count_label', 'Effective Stats')}: {score.effective_count}", font=self._get_font(22), fill=(180, 180, 180))
+            draw.text((cx, y + h - 50), f"{tr('effective_count_label', 'Effective Stats')}: {score.effective_count}", font=self._fonts[22], fill=(180, 180, 180))
+
+    def _rating_style(self, rating_key: str) -> Tuple[str, Tuple[int, int, int]]:
+        style = self._rating_styles.get(rating_key)
+        if style is None:
+            parts = rating_key.split("_", 2)
+            tier = parts[1] if len(parts) > 1 else rating_key
+            style = self._rating_styles[rating_key] = self.RATING_STYLES.get(tier.lower(), self.UNKNOWN_RATING_STYLE)
+        return style
 
     def _format_rating(self, rating_key: str) -> str:
-        for r in ["SSS", "SS", "S", "A", "B", "C"]:
-            if r.lower() in rating_key: return r
-        return "?"
\ No newline at end of file
+        return self._rating_style(rating_key)[0]
\ No newline at end of file
@@ -1,9 +1,12 @@
+from typing import Dict, Tuple
+
+from core.scoring.base import ScoringStrategy
 from core.scoring.methods import (
     NormalizedScoring,
     RatioScoring,
     RollQualityScoring,
     EffectiveStatsScoring,
-    CVScoring
+    CVScoring,
 )
 
 SCORING_METHODS = [
@@ -14,8 +17,34 @@ SCORING_METHODS = [
     CVScoring()
 ]
 
+# Bit i of a methods mask selects SCORING_METHODS[i]
+METHOD_NAMES = tuple(method.name() for method in SCORING_METHODS)
+ALL_METHODS_MASK = (1 << len(SCORING_METHODS)) - 1
+
+_methods_by_mask: Dict[int, Tuple[Tuple[str, ScoringStrategy], ...]] = {}
+
 def get_scoring_method(name: str):
     for method in SCORING_METHODS:
         if method.name() == name:
             return method
     return None
+
+def methods_to_mask(enabled_methods: Dict[str, bool]) -> int:
+    """Encodes an enabled-methods dict as a bitmask over SCORING_METHODS."""
+    mask = 0
+    for bit, name in enumerate(METHOD_NAMES):
+        if enabled_methods.get(name):
+            mask |= 1 << bit
+    return mask
+
+def get_enabled_methods(mask: int) -> Tuple[Tuple[str, ScoringStrategy], ...]:
+    """Returns (name, strategy) pairs selected by mask, resolved once per distinct mask."""
+    methods = _methods_by_mask.get(mask)
+    if methods is None:
+        methods = tuple(
+            (name, strategy)
+            for bit, (name, strategy) in enumerate(zip(METHOD_NAMES, SCORING_METHODS))
+            if mask & (1 << bit)
+        )
+        _methods_by_mask[mask] = methods
+    return methods
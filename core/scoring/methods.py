@@ -1,4 +1,5 @@
-from typing import Dict, Any, Optional
+from bisect import bisect_right
+from typing import Dict, Any, NamedTuple, Optional, Tuple
 from core.scoring.base import ScoringStrategy
 from utils.constants import (
     STAT_CRIT_RATE,
@@ -16,38 +17,137 @@ from utils.constants import (
     DAMAGE_BONUS_STATS,
 )
 
+# config key for the per-batch StatCoefficients
+STAT_COEFFICIENTS_KEY = "_stat_coefficients"
+
+
+class StatCoefficients(NamedTuple):
+    """Per-stat scoring constants folded from one weights mapping and config."""
+
+    stat_weights: Dict[str, float]  # the mapping these tables were built from
+    ratio: Dict[str, float]  # stat -> weight / max_value / 5
+    effective: Dict[str, float]  # effective stat -> weight / max_value * base_multiplier
+    unweighted_is_effective: bool  # stats missing from stat_weights (weight 0) pass the threshold
+    roll: Dict[str, Tuple[Tuple[float, ...], Tuple[float, ...]]]  # stat -> (low/good/max thresholds, points by tier)
+    cv: Optional[Dict[str, float]]  # stat -> CV points per unit; None if the CV config cannot be folded
+
+
+def precompute_stat_coefficients(config: Dict[str, Any], stat_weights: Dict[str, float]) -> None:
+    """
+    Cache each weighted stat's per-unit score contributions in config.
+
+    Call once per batch so the scoring methods do one lookup per substat
+    instead of repeated weight/config lookups and divisions.
+    """
+    max_vals = config.get("substat_max_values", {})
+    es_config = config.get("effective_stats", {})
+    min_weight = es_config.get("threshold", 0.5) - 1e-9
+    base_mult = es_config.get("base_multiplier", 20.0)
+
+    ratio = {}
+    effective = {}
+    for stat_name, weight in stat_weights.items():
+        max_val = max_vals.get(stat_name, 1.0)
+        if weight:
+            # Zero-weight stats stay out of the table and fall back to 0.0 on lookup
+            ratio[stat_name] = weight / max_val / 5.0
+        if weight >= min_weight:
+            effective[stat_name] = weight / max_val * base_mult
+
+    roll = {}
+    rq_config = config.get("roll_quality", {})
+    if rq_config:
+        points_cfg = rq_config.get("points", {})
+        points = (
+            points_cfg.get("Default", 0.5),
+            points_cfg.get("Low", 1.0),
+            points_cfg.get("Good", 2.0),
+            points_cfg.get("Max", 3.0),
+        )
+        for stat_name, ranges in rq_config.get("ranges", {}).items():
+            weight = stat_weights.get(stat_name, 0.5)
+            # Clamp so the thresholds ascend; the Max-first ladder picks the same tier either way
+            max_t = ranges.get("Max", 999.0)
+            good_t = min(ranges.get("Good", 999.0), max_t)
+            low_t = min(ranges.get("Low", 999.0), good_t)
+            roll[stat_name] = ((low_t, good_t, max_t), tuple(point * weight for point in points))
+
+    config[STAT_COEFFICIENTS_KEY] = StatCoefficients(
+        stat_weights, ratio, effective, 0.0 >= min_weight, roll, _cv_coefficients(config, stat_weights)
+    )
+
+
+def _cv_coefficients(config: Dict[str, Any], stat_weights: Dict[str, float]) -> Optional[Dict[str, float]]:
+    """Folds the CV weights into one per-unit multiplier per stat, matching CVScoring's terms."""
+    cv_weights = config.get("cv_weights", {})
+    flat_atk_div = cv_weights.get(CV_KEY_ATK_FLAT_DIVISOR, 10.0)
+    if not flat_atk_div:
+        # Leave the division (and its error) to the unfolded path
+        return None
+
+    coefficients: Dict[str, float] = {}
+
+    def add(stat_name: str, multiplier: float) -> None:
+        if multiplier:
+            coefficients[stat_name] = coefficients.get(stat_name, 0.0) + multiplier
+
+    add(STAT_CRIT_RATE, cv_weights.get(CV_KEY_CRIT_RATE, 2.0))
+    add(STAT_CRIT_DMG, cv_weights.get(CV_KEY_CRIT_DMG, 1.0))
+    add(STAT_ATK_PERCENT, cv_weights.get(CV_KEY_ATK_PERCENT, 1.1))
+    add(STAT_ATK_FLAT, cv_weights.get(CV_KEY_ATK_FLAT_MULTIPLIER, 1.2) / flat_atk_div)
+    add(STAT_ER, cv_weights.get(CV_KEY_ER, 0.5))
+    dmg_bonus_weight = cv_weights.get(CV_KEY_DMG_BONUS, 1.1)
+    for stat_name in DAMAGE_BONUS_STATS:
+        add(stat_name, dmg_bonus_weight * stat_weights.get(stat_name, 0.5))
+    return coefficients
+
+
+def _cached_coefficients(stat_weights: Dict[str, float], config: Dict[str, Any]) -> Optional[StatCoefficients]:
+    """Returns the precomputed tables if they were built for these stat_weights."""
+    cached = config.get(STAT_COEFFICIENTS_KEY)
+    if cached is not None and cached.stat_weights is stat_weights:
+        return cached
+    return None
+
+
+def _weighted_ratio_sum(echo: Any, stat_weights: Dict[str, float], config: Dict[str, Any]) -> float:
+    """Sum of (value / max_value / 5) * weight over the echo's substats."""
+    cached = _cached_coefficients(stat_weights, config)
+    if cached is not None:
+        coefficients = cached.ratio
+        return sum(stat_value * coefficients.get(stat_name, 0.0) for stat_name, stat_value in echo.substats.items())
+
+    max_vals = config.get("substat_max_values", {})
+    total = 0.0
+    for stat_name, stat_value in echo.substats.items():
+        weight = stat_weights.get(stat_name, 0.0)
+        if weight == 0.0:
+            continue
+        max_val = max_vals.get(stat_name, 1.0)
+        total += (stat_value / max_val / 5.0) * weight
+    return total
+
+
 class NormalizedScoring(ScoringStrategy):
     def name(self) -> str:
         return "normalized"
 
     def calculate(self, echo: Any, stat_weights: Dict[str, float], config: Dict[str, Any]) -> float:
-        max_vals = config.get("substat_max_values", {})
         main_mult = config.get("main_stat_multiplier", 15.0)
         
         main_score = main_mult
-        sub_score = 0.0
-        for stat_name, stat_value in echo.substats.items():
-            max_val = max_vals.get(stat_name, 1.0)
-            weight = stat_weights.get(stat_name, 0.0)
-            normalized = (stat_value / max_val / 5.0) * weight * 100.0
-            sub_score += normalized
+        sub_score = _weighted_ratio_sum(echo, stat_weights, config) * 100.0
 
-        return (echo.level / 25.0) * (main_score + sub_score)
+        return echo.level_scale * (main_score + sub_score)
 
 class RatioScoring(ScoringStrategy):
     def name(self) -> str:
         return "ratio"
 
     def calculate(self, echo: Any, stat_weights: Dict[str, float], config: Dict[str, Any]) -> float:
-        max_vals = config.get("substat_max_values", {})
-        score_ratio = 0.0
-        for stat_name, stat_value in echo.substats.items():
-            max_val = max_vals.get(stat_name, 1.0)
-            importance = stat_weights.get(stat_name, 0.0)
-            ratio = (stat_value / max_val / 5.0) * importance
-            score_ratio += ratio
+        score_ratio = _weighted_ratio_sum(echo, stat_weights, config)
 
-        return (100.0 * echo.level / 25.0) * score_ratio
+        return 100.0 * echo.level_scale * score_ratio
 
 class RollQualityScoring(ScoringStrategy):
     def name(self) -> str:
@@ -58,11 +158,24 @@ class RollQualityScoring(ScoringStrategy):
         if not rq_config:
             return 0.0
 
-        ranges_cfg = rq_config.get("ranges", {})
-        points_cfg = rq_config.get("points", {})
         quality_points = 0.0
         count = 0
 
+        cached = _cached_coefficients(stat_weights, config)
+        if cached is not None:
+            roll = cached.roll
+            for stat_name, stat_value in echo.substats.items():
+                entry = roll.get(stat_name)
+                if entry is None:
+                    continue
+                thresholds, points = entry
+                quality_points += points[bisect_right(thresholds, stat_value)]
+                count += 1
+            score = (quality_points / (count * 3.0)) * 100.0 if count > 0 else 0.0
+            return score * echo.level_scale
+
+        ranges_cfg = rq_config.get("ranges", {})
+        points_cfg = rq_config.get("points", {})
         for stat_name, stat_value in echo.substats.items():
             if stat_name not in ranges_cfg:
                 continue
@@ -81,7 +194,7 @@ class RollQualityScoring(ScoringStrategy):
             count += 1
 
         score = (quality_points / (count * 3.0)) * 100.0 if count > 0 else 0.0
-        return score * (echo.level / 25.0)
+        return score * echo.level_scale
 
 class EffectiveStatsScoring(ScoringStrategy):
     def name(self) -> str:
@@ -96,17 +209,30 @@ class EffectiveStatsScoring(ScoringStrategy):
         
         effective_count = 0
         total_contribution = 0.0
-        eps = 1e-9
 
-        for stat_name, stat_value in echo.substats.items():
-            weight = stat_weights.get(stat_name, 0.0)
-            if weight >= (threshold - eps):
-                effective_count += 1
-                max_val = max_vals.get(stat_name, 1.0)
-                total_contribution += (stat_value / max_val) * weight * base_mult
+        cached = _cached_coefficients(stat_weights, config)
+        if cached is not None:
+            coefficients, unweighted_is_effective = cached.effective, cached.unweighted_is_effective
+            for stat_name, stat_value in echo.substats.items():
+                coefficient = coefficients.get(stat_name)
+                if coefficient is not None:
+                    effective_count += 1
+                    total_contribution += stat_value * coefficient
+                elif unweighted_is_effective and stat_name not in stat_weights:
+                    effective_count += 1
+        else:
+            min_weight = threshold - 1e-9
+            for stat_name, stat_value in echo.substats.items():
+                weight = stat_weights.get(stat_name, 0.0)
+                if weight >= min_weight:
+                    effective_count += 1
+                    if weight == 0.0:
+                        continue
+                    max_val = max_vals.get(stat_name, 1.0)
+                    total_contribution += (stat_value / max_val) * weight * base_mult
 
         bonus = bonus_mults.get(str(effective_count), bonus_mults.get("default", 0.5))
-        score = total_contribution * bonus * (echo.level / 25.0)
+        score = total_contribution * bonus * echo.level_scale
         # Side effect: updating echo.effective_stats_count is expected by evaluate_comprehensive
         echo.effective_stats_count = effective_count
         return score
@@ -116,6 +242,14 @@ class CVScoring(ScoringStrategy):
         return "cv"
 
     def calculate(self, echo: Any, stat_weights: Dict[str, float], config: Dict[str, Any]) -> float:
+        cached = _cached_coefficients(stat_weights, config)
+        if cached is not None and cached.cv is not None:
+            coefficients = cached.cv
+            cv_score = sum(
+                stat_value * coefficients.get(stat_name, 0.0) for stat_name, stat_value in echo.substats.items()
+            )
+            return cv_score * echo.level_scale
+
         cv_weights = config.get("cv_weights", {})
         cv_score = 0.0
 
@@ -137,8 +271,9 @@ class CVScoring(ScoringStrategy):
         dmg_bonus_weight = cv_weights.get(CV_KEY_DMG_BONUS, 1.1)
         for stat_name in DAMAGE_BONUS_STATS:
             if stat_name in echo.substats:
-                val = echo.substats[stat_name]
                 weight = stat_weights.get(stat_name, 0.5)
-                cv_score += val * dmg_bonus_weight * weight
+                if weight == 0.0:
+                    continue
+                cv_score += echo.substats[stat_name] * dmg_bonus_weight * weight
 
-        return cv_score * (echo.level / 25.0)
+        return cv_score * echo.level_scale
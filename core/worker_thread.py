@@ -5,13 +5,15 @@ Provides background threads for long-running tasks like OCR to prevent UI freezi
 """
 
 from PySide6.QtCore import QThread, Signal, QObject
-from typing import List
-from PIL import Image
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import List, Optional
 import os
 import traceback
 
 from core.data_contracts import BatchItemResult, CropConfig
 from core.app_logic import AppLogic
+from utils.constants import OCR_BATCH_MAX_WORKERS
+from utils.utils import crop_image_by_percent, open_image
 
 
 class WorkerSignals(QObject):
@@ -54,51 +56,84 @@ class OCRWorker(QThread):
     def run(self):
         """
         Long-running task.
+
+        Images are processed on a bounded pool: each OCR call runs Tesseract as a
+        child process, so images overlap. Progress is reported as each image finishes,
+        while results are still emitted in input order so tabs are filled predictably.
         """
         total = len(self.file_paths)
-        for i, file_path in enumerate(self.file_paths):
-            if self.is_cancelled:
-                self.signals.log.emit("Batch processing cancelled.")
-                break
-
-            try:
-                if not os.path.isfile(file_path):
-                    continue
-
-                # Load image here (in background thread)
-                image = Image.open(file_path)
-                image.load()
-
-                # Apply crop if needed
-                from utils.utils import crop_image_by_percent
-
-                if self.crop_params.mode == "percent":
-                    cropped_img = crop_image_by_percent(
-                        image,
-                        self.crop_params.left_p,
-                        self.crop_params.top_p,
-                        self.crop_params.width_p,
-                        self.crop_params.height_p,
-                    )
-                else:
-                    cropped_img = image.copy()
-
-                # Perform OCR
-                result = self.app_logic.perform_ocr_workflow(cropped_img, self.language)
-
-                # Emit BatchItemResult
-                self.signals.result.emit(
-                    BatchItemResult(file_path=file_path, result=result, original_image=image, cropped_image=cropped_img)
-                )
-
-            except Exception as e:
-                traceback.print_exc()
-                exctype, value = type(e), e
-                self.signals.error.emit((exctype, value, traceback.format_exc()))
-
-            self.signals.progress.emit(i + 1, total)
+        max_workers = max(1, min(OCR_BATCH_MAX_WORKERS, QThread.idealThreadCount(), total))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            ordered = [pool.submit(self._process_file, file_path) for file_path in self.file_paths]
+            futures = {future: i for i, future in enumerate(ordered)}
+            finished = {}
+            next_index = 0
+            completed = 0
+            for future in as_completed(futures):
+                if self.is_cancelled:
+                    for pending in futures:
+                        pending.cancel()
+                    self.signals.log.emit("Batch processing cancelled.")
+                    break
+
+                completed += 1
+                finished[futures[future]] = future
+                if future.exception() is not None or future.result() is not None:
+                    self.signals.progress.emit(completed, total)
+
+                # Release every result whose predecessors are all done
+                while next_index in finished:
+                    self._emit_result(finished.pop(next_index))
+                    next_index += 1
+
+        # Leaving the pool waits for images already running; emit everything finished but not yet released
+        if self.is_cancelled:
+            for future in ordered[next_index:]:
+                if not future.cancelled():
+                    self._emit_result(future)
 
         self.signals.finished.emit()
 
+    def _emit_result(self, future: "Future[Optional[BatchItemResult]]") -> None:
+        """Emit a finished image's result, or its error."""
+        try:
+            item = future.result()
+        except Exception as e:
+            traceback.print_exc()
+            exctype, value = type(e), e
+            self.signals.error.emit((exctype, value, traceback.format_exc()))
+            return
+
+        # Emit BatchItemResult
+        if item is not None:
+            self.signals.result.emit(item)
+
+    def _process_file(self, file_path: str) -> Optional[BatchItemResult]:
+        """Load, crop and OCR a single image (runs on a pool thread)."""
+        if self.is_cancelled or not os.path.isfile(file_path):
+            return None
+
+        # Load image here (in background thread)
+        image = open_image(file_path)
+
+        # Apply crop if needed
+
+        if self.crop_params.mode == "percent":
+            cropped_img = crop_image_by_percent(
+                image,
+                self.crop_params.left_p,
+                self.crop_params.top_p,
+                self.crop_params.width_p,
+                self.crop_params.height_p,
+            )
+        else:
+            cropped_img = image
+
+        # Perform OCR
+        result = self.app_logic.perform_ocr_workflow(cropped_img, self.language, source=file_path)
+        # Tabs only use the crop; dropping the full-resolution source keeps batch memory to one crop per image
+        return BatchItemResult(file_path=file_path, result=result, original_image=None, cropped_image=cropped_img)
+
     def cancel(self):
         self.is_cancelled = True
@@ -4,7 +4,7 @@ import os
 import copy
 import re
 from PySide6.QtCore import QObject, Signal
-from typing import Optional
+from typing import Dict, Optional
 
 from utils.utils import get_app_path, get_resource_path
 from utils.constants import DEFAULT_COST_CONFIG, DIR_CHARACTER_SETTINGS, EQUIPPED_ECHOES_FILENAME, STAT_CRIT_RATE
@@ -38,6 +38,7 @@ class CharacterManager(QObject):
         self._scaling_stats = {}  # Stores primary scaling stat name
         self._elements = {}  # New: Stores character element
         self._equipped_echoes = {}  # character -> {slot -> EchoEntry}
+        self._profile_cache: Dict[str, CharacterProfile] = {}  # Cleared whenever profile data changes
 
         self.tab_configs = data_manager.tab_configs
 
@@ -109,6 +110,7 @@ class CharacterManager(QObject):
     def _load_character_profiles(self):
         """Loads character profiles from JSON files in the character_settings_jsons directory."""
         self.logger.info("Loading character profiles...")
+        self._profile_cache.clear()
 
         # Paths to check: bundled resources first, then user directory (user dir can override)
         search_dirs = [get_resource_path(DIR_CHARACTER_SETTINGS), os.path.join(get_app_path(), DIR_CHARACTER_SETTINGS)]
@@ -265,6 +267,7 @@ class CharacterManager(QObject):
             self.logger.info(f"Character profile saved: {internal_char_name} -> {file_path}")
 
             # --- Update internal data stores ---
+            self._profile_cache.clear()
             self._stat_weights[internal_char_name] = weights
             self._main_stats[internal_char_name] = normalized_mainstats
             self._name_map_en_to_jp[internal_char_name] = name_jp
@@ -344,6 +347,7 @@ class CharacterManager(QObject):
             return
 
         self.logger.info(f"Temporarily updating data for character: {internal_name}")
+        self._profile_cache.clear()
         self._stat_weights[internal_name] = weights
         self._main_stats[internal_name] = mainstats
         self._name_map_en_to_jp[internal_name] = jp_name
@@ -380,6 +384,10 @@ class CharacterManager(QObject):
         if not internal_name:
             return None
 
+        profile = self._profile_cache.get(internal_name)
+        if profile is not None:
+            return profile
+
         jp_name = self.get_display_name(internal_name)
         cost_config = self.get_character_config_key(internal_name) or DEFAULT_COST_CONFIG
 
@@ -396,7 +404,7 @@ class CharacterManager(QObject):
         scaling_stat = self._scaling_stats.get(internal_name, "攻撃力")
         element = self._elements.get(internal_name, "電導")
 
-        return CharacterProfile(
+        profile = CharacterProfile(
             internal_name=internal_name,
             jp_name=jp_name,
             cost_config=cost_config,
@@ -408,3 +416,5 @@ class CharacterManager(QObject):
             scaling_stat=scaling_stat,
             element=element,
         )
+        self._profile_cache[internal_name] = profile
+        return profile
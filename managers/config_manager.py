@@ -57,6 +57,7 @@ class AppConfig:
     # OCR
     ocr_engine: str = "pillow"  # Standard engine
     skip_duplicate_ocr: bool = True  # New setting for input skipping
+    ocr_downscale_large: bool = True  # Shrink oversized crops before Tesseract
 
     transparent_frames: bool = False
     show_text_shadow: bool = True
@@ -1,14 +1,103 @@
 import json
+import mmap
 import os
+import pickle
+import tempfile
 import logging
-from typing import Dict, Any, List
+from functools import cached_property
+from typing import Dict, Any, List, Tuple
 
 from utils.constants import (
     RES_GAME_DATA,
     RES_CALC_CONFIG,
+    DATA_CACHE_SUFFIX,
 )
 from core.data_contracts import DataLoadError
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    _has_orjson = True
+except ImportError:
+    _json_loads = json.loads
+    _has_orjson = False
+
+# Cached accessors derived from each file, re-resolved whenever that file is (re)loaded
+_GAME_DATA_PROPERTIES = (
+    "substat_max_values",
+    "main_stat_options",
+    "substat_types",
+    "character_stat_weights",
+    "character_main_stats",
+    "stat_aliases",
+    "tab_configs",
+    "char_name_map_jp_to_en",
+    "character_config_map",
+)
+_CALC_CONFIG_PROPERTIES = (
+    "main_stat_multiplier",
+    "roll_quality_config",
+    "effective_stats_config",
+    "cv_weights",
+)
+
+# Sequential read-ahead hint for the one-shot reads below (POSIX only)
+_has_fadvise = hasattr(os, "posix_fadvise")
+
+# Below this size a plain read is cheaper than setting up a mapping
+_MMAP_MIN_BYTES = 64 * 1024
+
+
+def _load_json_file(path: str) -> Any:
+    """Parses a UTF-8 JSON file, using orjson when it is installed."""
+    # Unbuffered: the whole file is read in one go, so a BufferedReader would only add a copy
+    with open(path, "rb", buffering=0) as f:
+        if _has_fadvise:
+            try:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass  # Only a hint
+        # orjson parses straight from a buffer; the stdlib parser would need a copy anyway
+        if _has_orjson and os.fstat(f.fileno()).st_size >= _MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return _json_loads(view)
+        return _json_loads(f.read())
+
+
+def _load_json_cached(path: str) -> Any:
+    """
+    Loads a JSON file through a pickled sidecar (<path>.pkl) stamped with the file's mtime and size.
+
+    The sidecar is rewritten whenever the stamp no longer matches; a missing,
+    stale or unreadable sidecar just falls back to parsing the JSON.
+    """
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cache_path = path + DATA_CACHE_SUFFIX
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, data = pickle.load(f)
+        if cached_stamp == stamp:
+            return data
+    except Exception:
+        pass
+
+    data = _load_json_file(path)
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path) or ".", suffix=".tmp")
+        try:
+            with open(fd, "wb") as f:
+                pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except OSError:
+        # Read-only install locations simply go without the cache
+        pass
+    return data
+
 
 class DataManager:
     """
@@ -73,8 +162,9 @@ class DataManager:
             raise DataLoadError(f"Game data file missing: {self.game_data_path}")
 
         try:
-            with open(self.game_data_path, "r", encoding="utf-8") as f:
-                self.game_data = json.load(f)
+            self.game_data = _load_json_cached(self.game_data_path)
+            self._refresh_cached(_GAME_DATA_PROPERTIES)
+            self._alias_pairs_cache = None
             self.logger.info(f"Loaded game data from {self.game_data_path}")
         except json.JSONDecodeError as e:
             self.logger.critical(f"Invalid JSON in game data: {e}")
@@ -94,8 +184,8 @@ class DataManager:
             raise DataLoadError(f"Config file missing: {self.calc_config_path}")
 
         try:
-            with open(self.calc_config_path, "r", encoding="utf-8") as f:
-                self.calc_config = json.load(f)
+            self.calc_config = _load_json_cached(self.calc_config_path)
+            self._refresh_cached(_CALC_CONFIG_PROPERTIES)
             self.logger.info(f"Loaded calculation config from {self.calc_config_path}")
         except json.JSONDecodeError as e:
             self.logger.critical(f"Invalid JSON in calculation config: {e}")
@@ -104,62 +194,69 @@ class DataManager:
             self.logger.critical(f"Failed to load calculation config: {e}")
             raise DataLoadError(f"Failed to load calculation config: {e}")
 
+    def _refresh_cached(self, names: Tuple[str, ...]) -> None:
+        """Re-resolves cached properties from the loaded data, so every later access is a plain attribute read."""
+        for name in names:
+            self.__dict__.pop(name, None)
+            getattr(self, name)
+
     # --- Property Accessors for Convenience ---
+    # Values are cached per instance, so repeated lookups return the same objects
 
-    @property
+    @cached_property
     def substat_max_values(self) -> Dict[str, float]:
         val = self.game_data.get("substat_max_values", {})
         return val if isinstance(val, dict) else {}
 
-    @property
+    @cached_property
     def main_stat_options(self) -> Dict[str, List[str]]:
         val = self.game_data.get("main_stat_options", {})
         return val if isinstance(val, dict) else {}
 
-    @property
+    @cached_property
     def substat_types(self) -> Dict[str, str]:
         val = self.game_data.get("substat_types", {})
         return val if isinstance(val, dict) else {}
 
-    @property
+    @cached_property
     def character_stat_weights(self) -> Dict[str, Dict[str, float]]:
         val = self.game_data.get("character_stat_weights", {})
         return val if isinstance(val, dict) else {}
 
-    @property
+    @cached_property
     def character_main_stats(self) -> Dict[str, Dict[str, str]]:
         val = self.game_data.get("character_main_stats", {})
         return val if isinstance(val, dict) else {}
 
-    @property
+    @cached_property
     def stat_aliases(self) -> Dict[str, List[str]]:
         return self.game_data.get("stat_aliases", {})
 
-    @property
+    @cached_property
     def tab_configs(self) -> Dict[str, List[str]]:
         return self.game_data.get("tab_configs", {})
 
-    @property
+    @cached_property
     def char_name_map_jp_to_en(self) -> Dict[str, str]:
         return self.game_data.get("char_name_map_jp_to_en", {})
 
-    @property
+    @cached_property
     def main_stat_multiplier(self) -> float:
         return self.calc_config.get("main_stat_multiplier", 15.0)
 
-    @property
+    @cached_property
     def roll_quality_config(self) -> Dict[str, Any]:
         return self.calc_config.get("roll_quality", {})
 
-    @property
+    @cached_property
     def effective_stats_config(self) -> Dict[str, Any]:
         return self.calc_config.get("effective_stats", {})
 
-    @property
+    @cached_property
     def cv_weights(self) -> Dict[str, float]:
         return self.calc_config.get("cv_weights", {})
 
-    @property
+    @cached_property
     def character_config_map(self) -> Dict[str, str]:
         return self.game_data.get("character_config_map", {})
 
@@ -2,8 +2,9 @@ import json
 import os
 import logging
 import re
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 from core.data_contracts import HistoryEntry
 from utils.utils import get_app_path
 from utils.constants import HISTORY_FILENAME
@@ -17,6 +18,8 @@ class HistoryManager:
         self.max_entries = max_entries
         self.logger = logging.getLogger(__name__)
         self._history: List[HistoryEntry] = []
+        self._defer_depth = 0
+        self._save_pending = False
         self.load()
 
     def load(self) -> None:
@@ -67,6 +70,18 @@ class HistoryManager:
             self.logger.error(f"Failed to save history: {e}")
             return False
 
+    @contextmanager
+    def deferred_save(self) -> Iterator[None]:
+        """Coalesces saves from add_entry calls in the block into a single write on exit."""
+        self._defer_depth += 1
+        try:
+            yield
+        finally:
+            self._defer_depth -= 1
+            if self._defer_depth == 0 and self._save_pending:
+                self._save_pending = False
+                self.save()
+
     def add_entry(
         self,
         character: str,
@@ -115,7 +130,10 @@ class HistoryManager:
         if len(self._history) > self.max_entries:
             self._history = self._history[: self.max_entries]
 
-        self.save()
+        if self._defer_depth:
+            self._save_pending = True
+        else:
+            self.save()
 
     def find_duplicates(self, fingerprint: str) -> List[int]:
         """Returns a list of indices (IDs) where the fingerprint matches."""
@@ -134,55 +152,41 @@ class HistoryManager:
         name_map: Dict[str, str] = None,
         rating: str = "",
     ) -> List[HistoryEntry]:
-        """Returns filtered history entries."""
-        filtered = self._history
-
-        if keyword:
-            kw = keyword.lower()
-            new_filtered = []
-            for h in filtered:
-                match = kw in h.action.lower() or kw in h.result.lower() or kw in h.character.lower()
-
-                if not match and name_map and h.character in name_map:
-                    if kw in name_map[h.character].lower():
-                        match = True
+        """Returns filtered history entries.
 
-                if match:
-                    new_filtered.append(h)
-            filtered = new_filtered
-
-        if character:
-            filtered = [h for h in filtered if h.character == character]
-
-        if cost:
-            filtered = [h for h in filtered if h.cost == cost]
+        All filters are applied in a single pass, cheapest first: exact character/cost matches and the
+        timestamp range reject most rows before any lowercasing or regex work happens.
+        """
+        kw = keyword.lower()
+        to_val = f"{date_to} 23:59:59" if date_to else ""
 
         if rating:
             # Match rating precisely. Use rating_key if available in details,
             # otherwise fallback to regex on the result string for backward compatibility.
             target_key = f"rating_{rating.lower()}_single"
-            pattern = rf"(^|[\s\(]){re.escape(rating)}(\s|$|-)"
-
-            new_filtered = []
-            for h in filtered:
-                # 1. Check details for rating_key (robust)
-                r_key = h.details.get("rating_key")
-                if r_key == target_key:
-                    new_filtered.append(h)
+            rating_re = re.compile(rf"(^|[\s\(]){re.escape(rating)}(\s|$|-)")
+
+        filtered = []
+        for h in self._history:
+            if character and h.character != character:
+                continue
+            if cost and h.cost != cost:
+                continue
+            if date_from and h.timestamp < date_from:
+                continue
+            if to_val and h.timestamp > to_val:
+                continue
+
+            if kw and not (kw in h.action.lower() or kw in h.result.lower() or kw in h.character.lower()):
+                jp_name = name_map.get(h.character) if name_map else None
+                if jp_name is None or kw not in jp_name.lower():
                     continue
 
-                # 2. Fallback to result string regex (backward compatibility)
-                if re.search(pattern, h.result):
-                    new_filtered.append(h)
-
-            filtered = new_filtered
-
-        if date_from:
-            filtered = [h for h in filtered if h.timestamp >= date_from]
+            # 1. rating_key in details (robust), 2. result string regex (backward compatibility)
+            if rating and h.details.get("rating_key") != target_key and not rating_re.search(h.result):
+                continue
 
-        if date_to:
-            to_val = f"{date_to} 23:59:59"
-            filtered = [h for h in filtered if h.timestamp <= to_val]
+            filtered.append(h)
 
         return filtered
 
@@ -27,7 +27,7 @@ if TYPE_CHECKING:
 
 class TabImageData:
     """Container for original and cropped images associated with a tab."""
-    def __init__(self, original: Image.Image, cropped: Image.Image):
+    def __init__(self, original: Optional[Image.Image], cropped: Image.Image):
         self.original = original
         self.cropped = cropped
 
@@ -543,6 +543,7 @@ class TabManager(QObject):
             weights = profile.weights if profile else {}
             element = profile.element if profile else "電導"
             config_bundle = score_calculator._get_config_bundle()
+            eval_context = score_calculator._get_eval_context(character_name)
 
             for i, name in enumerate(tab_names):
                 entry = self.extract_tab_data(name) or EchoEntry(tab_index=i, cost="?")
@@ -554,7 +555,8 @@ class TabManager(QObject):
                 
                 evaluation = score_calculator._process_echo_evaluation(
                     entry, weights, config_bundle, enabled_methods, 
-                    character_name, "SCOREBOARD", name, record_history=False
+                    character_name, "SCOREBOARD", name, record_history=False,
+                    eval_context=eval_context
                 )
                 scores.append(evaluation)
 
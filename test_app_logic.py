@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from core.app_logic import AppLogic
 
 
@@ -95,5 +95,25 @@ class TestAppLogicMainStatDetection(unittest.TestCase):
         self.assertIsNone(result)
 
 
+class TestAppLogicOcrLogging(unittest.TestCase):
+    def setUp(self):
+        self.logic = AppLogic(MagicMock(return_value="translated"), MagicMock(), MagicMock())
+
+    @patch("core.app_logic.is_pytesseract_installed", True)
+    @patch("core.app_logic.pytesseract")
+    def test_ocr_log_lines_name_their_source(self, mock_tesseract):
+        mock_tesseract.image_to_string.return_value = "raw".encode("utf-8")
+        mock_tesseract.image_to_data.return_value = {"text": ["raw"]}
+        self.logic._preprocess_for_ocr = MagicMock(return_value=MagicMock(size=(8, 8), mode="L"))
+        messages = []
+        self.logic.log_message.connect(messages.append)
+
+        self.logic._perform_ocr_with_boxes(MagicMock(), "ja", source="shots/a.png")
+
+        self.assertEqual(len(messages), 3)
+        for message in messages:
+            self.assertTrue(message.startswith("[shots/a.png] "), message)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -82,6 +82,39 @@ class TestEchoData(unittest.TestCase):
         self.assertIn("total_score", result)
         self.assertIn("individual_scores", result)
 
+    def test_evaluate_comprehensive_methods_mask(self):
+        from core.scoring import methods_to_mask
+
+        weights = {"Crit. DMG": 1.0, "ATK": 0.5}
+        config_bundle = {
+            "substat_max_values": {"Crit. DMG": 21.0, "ATK": 11.6},
+            "main_stat_multiplier": 15.0,
+            "cv_weights": {"crit_rate": 2.0, "crit_dmg": 1.0},
+        }
+        enabled = {"normalized": True, "ratio": False, "roll": False, "effective": False, "cv": True}
+
+        by_dict = self.echo.evaluate_comprehensive(weights, config_bundle, enabled)
+        by_mask = self.echo.evaluate_comprehensive(weights, config_bundle, methods_to_mask(enabled))
+        self.assertEqual(by_dict.individual_scores, by_mask.individual_scores)
+        self.assertEqual(set(by_mask.individual_scores), {"normalized", "cv", "achievement"})
+
+    def test_precomputed_stat_coefficients_match(self):
+        from core.scoring.methods import precompute_stat_coefficients
+
+        weights = {"Crit. DMG": 1.0, "ATK": 0.5, "Energy Regen": 0.8}
+        config_bundle = {
+            "substat_max_values": {"Crit. DMG": 21.0, "ATK": 11.6},
+            "main_stat_multiplier": 15.0,
+            "cv_weights": {"crit_rate": 2.0, "crit_dmg": 1.0},
+        }
+        enabled = {"normalized": True, "ratio": True, "roll": False, "effective": True, "cv": True}
+
+        plain = self.echo.evaluate_comprehensive(weights, dict(config_bundle), enabled)
+        precompute_stat_coefficients(config_bundle, weights)
+        cached = self.echo.evaluate_comprehensive(weights, config_bundle, enabled)
+        for method in ("normalized", "ratio", "effective", "cv"):
+            self.assertAlmostEqual(plain.individual_scores[method], cached.individual_scores[method])
+
     def test_entry_contracts(self):
         sub_list = [SubStat(stat="ATK", value="10%")]
         entry = EchoEntry(tab_index=0, cost="3", main_stat="Havoc DMG Bonus", substats=sub_list)
@@ -57,6 +57,65 @@ class TestImageProcessorDecoupling(unittest.TestCase):
             # Should emit image_updated with the cropped image
             mock_slot.assert_called_with(mock_cropped_image)
 
+    def test_run_ocr_emits_result_with_images(self):
+        from core.data_contracts import OCRResult
+
+        self.processor.original_image = MagicMock()
+        self.processor.loaded_image = MagicMock()
+        self.processor._ocr_cache_key = MagicMock(return_value=None)
+        app_config = MagicMock(language="ja", auto_calculate=False)
+        parsed = OCRResult(substats=[], log_messages=[], cost="4", main_stat=None, raw_text="text")
+
+        self.mock_logic._perform_ocr.return_value = "text"
+        self.mock_logic._parse_ocr_text.return_value = parsed
+        mock_slot = MagicMock()
+        self.processor.ocr_completed.connect(mock_slot)
+
+        self.processor.run_ocr(app_config)
+        self.mock_logic._perform_ocr.return_value = ""
+        self.processor.run_ocr(app_config)
+
+        self.assertEqual(mock_slot.call_count, 2)
+        for call in mock_slot.call_args_list:
+            result = call.args[0]
+            self.assertIsInstance(result, OCRResult)
+            self.assertIs(result.cropped_image, self.processor.loaded_image)
+            self.assertIsNotNone(result.original_image)
+
+    def test_previews_of_non_rgb_source_are_rgb(self):
+        from PIL import Image, ImageQt
+
+        app_config = self.mock_app.get_app_config.return_value
+        app_config.crop_left_percent, app_config.crop_top_percent = 10.0, 10.0
+        app_config.crop_width_percent, app_config.crop_height_percent = 50.0, 50.0
+        self.processor.original_image = Image.new("LA", (40, 30))
+        self.processor.loaded_image = None
+
+        mock_slot = MagicMock()
+        self.processor.image_updated.connect(mock_slot)
+        self.processor.perform_crop_preview()
+        self.processor.perform_image_preview_update_on_resize()
+
+        for call in mock_slot.call_args_list:
+            self.assertEqual(call.args[0].mode, "RGB")
+            ImageQt.ImageQt(call.args[0])
+
+    def test_ocr_cache_is_keyed_on_downscale_setting(self):
+        from PIL import Image
+
+        self.processor.loaded_image = Image.new("RGB", (8, 8))
+        self.processor.original_image = self.processor.loaded_image
+        app_config = MagicMock(language="ja", auto_calculate=False, ocr_downscale_large=True)
+        self.mock_logic._perform_ocr.return_value = "text"
+
+        self.processor.run_ocr(app_config)
+        self.processor.run_ocr(app_config)
+        self.assertEqual(self.mock_logic._perform_ocr.call_count, 1)
+
+        app_config.ocr_downscale_large = False
+        self.processor.run_ocr(app_config)
+        self.assertEqual(self.mock_logic._perform_ocr.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -67,6 +67,60 @@ class TestScoreCalculator(unittest.TestCase):
             duplicate_mode="latest",
         )
 
+    @patch("core.score_calculator.EchoData")
+    def test_process_echo_evaluation_reuses_cached_result(self, MockEchoData):
+        entry = EchoEntry(0, "4", "ATK%", [SubStat("Crit Rate", "10.0")])
+        mock_echo_instance = MockEchoData.return_value
+        mock_echo_instance.get_fingerprint.return_value = "hash123"
+        mock_echo_instance.evaluate_comprehensive.return_value = EvaluationResult(100.0, 1, "S", "S", {})
+
+        cache = {}
+        first = self.calculator._process_echo_evaluation(
+            entry, {}, {}, {}, "Char1", ACTION_SINGLE, "Tab1", evaluation_cache=cache
+        )
+        second = self.calculator._process_echo_evaluation(
+            entry, {}, {}, {}, "Char1", ACTION_SINGLE, "Tab2", evaluation_cache=cache
+        )
+
+        self.assertIs(first, second)
+        mock_echo_instance.evaluate_comprehensive.assert_called_once()
+        # Only scoring is cached: each tab is still checked for duplicates and recorded
+        self.assertEqual(self.mock_hm.find_duplicates.call_count, 2)
+        self.assertEqual(self.mock_hm.add_entry.call_count, 2)
+        self.assertEqual(self.mock_hm.add_entry.call_args.kwargs["fingerprint"], "hash123")
+
+    @patch("core.score_calculator.EchoData")
+    def test_cached_entry_skips_echo_construction(self, MockEchoData):
+        MockEchoData.return_value.get_fingerprint.return_value = "hash123"
+        MockEchoData.return_value.evaluate_comprehensive.return_value = EvaluationResult(100.0, 1, "S", "S", {})
+        subs = [SubStat("Crit Rate", "10.0"), SubStat("Crit DMG", "20.0")]
+
+        cache = {}
+        first = self.calculator._process_echo_evaluation(
+            EchoEntry(0, "4", "ATK%", subs), {}, {}, {}, "Char1", ACTION_SINGLE, "Tab1", evaluation_cache=cache
+        )
+        second = self.calculator._process_echo_evaluation(
+            EchoEntry(1, "4", "ATK%", subs[::-1]), {}, {}, {}, "Char1", ACTION_SINGLE, "Tab2", evaluation_cache=cache
+        )
+
+        self.assertIs(first, second)
+        MockEchoData.assert_called_once()
+
+    @patch("core.score_calculator.EchoData")
+    def test_repeated_stat_order_is_not_shared(self, MockEchoData):
+        MockEchoData.return_value.get_fingerprint.return_value = "hash123"
+        MockEchoData.return_value.evaluate_comprehensive.return_value = EvaluationResult(100.0, 1, "S", "S", {})
+        subs = [SubStat("Crit Rate", "5"), SubStat("Crit Rate", "10")]
+
+        cache = {}
+        for i, order in enumerate((subs, subs[::-1])):
+            self.calculator._process_echo_evaluation(
+                EchoEntry(i, "4", "ATK%", order), {}, {}, {}, "Char1", ACTION_SINGLE, "Tab", evaluation_cache=cache
+            )
+
+        # The last value wins when a stat repeats, so the two orders are different echoes
+        self.assertEqual(MockEchoData.call_count, 2)
+
     def test_calculate_single_calls_process(self):
         # Test that calculate_single correctly calls _process_echo_evaluation
         entry = EchoEntry(0, "4", "Main", [])
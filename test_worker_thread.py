@@ -0,0 +1,66 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from PIL import Image
+
+from core.data_contracts import CropConfig
+from core.worker_thread import OCRWorker
+
+
+class TestOCRWorker(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file_paths = []
+        for name in ("first.png", "second.png"):
+            path = os.path.join(self.tmp_dir.name, name)
+            Image.new("RGB", (8, 8)).save(path)
+            self.file_paths.append(path)
+        self.crop = CropConfig(mode="none", left_p=0.0, top_p=0.0, width_p=100.0, height_p=100.0)
+        self.logic = MagicMock()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _run(self, worker):
+        emitted = []
+        worker.signals.result.connect(lambda item: emitted.append(item.file_path))
+        worker.run()
+        return emitted
+
+    def test_workflow_receives_file_path_for_logging(self):
+        worker = OCRWorker(self.logic, self.file_paths, self.crop, "ja")
+
+        emitted = self._run(worker)
+
+        self.assertEqual(emitted, self.file_paths)
+        sources = sorted(call.kwargs["source"] for call in self.logic.perform_ocr_workflow.call_args_list)
+        self.assertEqual(sources, sorted(self.file_paths))
+
+    @patch("core.worker_thread.QThread.idealThreadCount", return_value=2)
+    def test_cancel_emits_results_already_finished(self, _mock_threads):
+        worker = OCRWorker(self.logic, self.file_paths, self.crop, "ja")
+        second_done = threading.Event()
+
+        def workflow(image, language, source=None):
+            if source == self.file_paths[0]:
+                # Finish after the second image, then cancel before the first is released
+                second_done.wait(timeout=5)
+                time.sleep(0.05)
+                worker.cancel()
+            else:
+                second_done.set()
+            return MagicMock()
+
+        self.logic.perform_ocr_workflow.side_effect = workflow
+
+        emitted = self._run(worker)
+
+        self.assertEqual(emitted, self.file_paths)
+
+
+if __name__ == "__main__":
+    unittest.main()
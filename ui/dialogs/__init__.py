@@ -1,8 +1,22 @@
-from .char_setting import CharSettingDialog
-from .crop import CropDialog, CropLabel
-from .display_settings import DisplaySettingsDialog
-from .image_preprocessing import ImagePreprocessingSettingsDialog
-from .history import HistoryDialog
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .char_setting import CharSettingDialog
+    from .crop import CropDialog, CropLabel
+    from .display_settings import DisplaySettingsDialog
+    from .image_preprocessing import ImagePreprocessingSettingsDialog
+    from .history import HistoryDialog
+
+# Dialogs are imported on first access so their modules load only when a dialog is opened
+_DIALOG_MODULES = {
+    "CharSettingDialog": ".char_setting",
+    "CropDialog": ".crop",
+    "CropLabel": ".crop",
+    "DisplaySettingsDialog": ".display_settings",
+    "ImagePreprocessingSettingsDialog": ".image_preprocessing",
+    "HistoryDialog": ".history",
+}
 
 __all__ = [
     "CharSettingDialog",
@@ -12,3 +26,16 @@ __all__ = [
     "ImagePreprocessingSettingsDialog",
     "HistoryDialog",
 ]
+
+
+def __getattr__(name):
+    module_name = _DIALOG_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,4 +1,9 @@
-from typing import Callable, Optional
+import heapq
+from collections import Counter
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from PySide6.QtCore import QStringListModel
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -14,9 +19,48 @@ from core.data_contracts import CharacterProfile
 from utils.constants import DIALOG_CHAR_SETTING_WIDTH, DIALOG_CHAR_SETTING_HEIGHT
 
 
+COST_PRESETS = MappingProxyType({"[4,3,3,1,1]": (4, 3, 3, 1, 1), "[4,4,1,1,1]": (4, 4, 1, 1, 1)})
+# Reverse map for loading: "43311" -> "[4,3,3,1,1]"
+COST_CONFIG_MAP = MappingProxyType({"".join(map(str, v)): k for k, v in COST_PRESETS.items()})
+WEIGHT_TEMPLATE_NAMES = ("General", "会心特化型", "バランス型", "スキル回転型")
+
+# (character_stat_weights the templates were filtered from, templates)
+_weight_templates_cache: Tuple[Optional[dict], Dict[str, dict]] = (None, {})
+
+
+def _get_weight_templates(all_weights: dict) -> Dict[str, dict]:
+    """Returns the template entries of all_weights, refiltered only when a different mapping is passed."""
+    global _weight_templates_cache
+    source, templates = _weight_templates_cache
+    if source is not all_weights:
+        templates = {k: v for k, v in all_weights.items() if k in WEIGHT_TEMPLATE_NAMES}
+        _weight_templates_cache = (all_weights, templates)
+    return templates
+
+
+def _iter_slot_keys(costs) -> Iterator[str]:
+    """Yields the main-stat key for each slot: the cost alone if unique, else "<cost>_<occurrence>"."""
+    cost_total = Counter(costs)
+    cost_occurrence = Counter()
+    for cost in costs:
+        if cost_total[cost] == 1:
+            yield str(cost)
+        else:
+            cost_occurrence[cost] += 1
+            yield f"{cost}_{cost_occurrence[cost]}"
+
+
+# Main-stat key of each slot per preset, e.g. "[4,3,3,1,1]" -> ("4", "3_1", "3_2", "1_1", "1_2")
+PRESET_SLOT_KEYS = MappingProxyType({k: tuple(_iter_slot_keys(v)) for k, v in COST_PRESETS.items()})
+
+
 class CharSettingDialog(QDialog):
     """Character settings dialog."""
 
+    # Effective-stat options model and the substat_max_values it was built from
+    _substat_model: Optional[QStringListModel] = None
+    _substat_model_source: Optional[dict] = None
+
     def __init__(self, parent, on_register_char: Callable, profile: Optional[CharacterProfile] = None):
         super().__init__(parent)
         self.app = parent
@@ -33,12 +77,20 @@ class CharSettingDialog(QDialog):
         self.resize(DIALOG_CHAR_SETTING_WIDTH, DIALOG_CHAR_SETTING_HEIGHT)
 
         # Definitions
-        self.cost_presets = {"[4,3,3,1,1]": [4, 3, 3, 1, 1], "[4,4,1,1,1]": [4, 4, 1, 1, 1]}
-        # Reverse map for loading: "43311" -> "[4,3,3,1,1]"
-        self.cost_config_map = {"".join(map(str, v)): k for k, v in self.cost_presets.items()}
+        self.cost_presets = COST_PRESETS
+        self.cost_config_map = COST_CONFIG_MAP
         # from constants import MAIN_STAT_OPTIONS, SUBSTAT_MAX_VALUES # Removed
         self.main_stats = self.app.data_manager.main_stat_options
         self.substat_candidates = list(self.app.data_manager.substat_max_values.keys())
+        # Every effective-stat combo lists [""] + substat_candidates, so one index map serves all of them
+        self._substat_index: Dict[str, int] = {}
+        for i, stat in enumerate([""] + self.substat_candidates):
+            self._substat_index.setdefault(stat, i)
+        # Template name -> [(slot, combo index, weight text), ...] for its first five resolvable entries
+        self._template_slots: Dict[str, List[Tuple[int, int, str]]] = {}
+        # Slot option lists per cost, shared by every slot combo of that cost ("" = unused slot)
+        self._main_stat_models: Dict[str, QStringListModel] = {}
+        self._preset_slots: Dict[str, List[Tuple[QStringListModel, str]]] = {}
 
         self.init_ui()
 
@@ -159,11 +211,7 @@ class CharSettingDialog(QDialog):
         self.combo_weight_template = QComboBox()
 
         # from constants import CHARACTER_STAT_WEIGHTS # Removed
-        self.weight_templates = {
-            k: v
-            for k, v in self.app.data_manager.character_stat_weights.items()
-            if k in ["General", "会心特化型", "バランス型", "スキル回転型"]
-        }
+        self.weight_templates = _get_weight_templates(self.app.data_manager.character_stat_weights)
         self.combo_weight_template.addItems([self.app.tr("custom")] + list(self.weight_templates.keys()))
         self.combo_weight_template.currentTextChanged.connect(self._apply_weight_template)
         template_layout.addWidget(self.combo_weight_template)
@@ -171,13 +219,14 @@ class CharSettingDialog(QDialog):
 
         self.eff_combos = []
         self.eff_weights = []
+        substat_model = self._get_substat_model(self.app.data_manager.substat_max_values)
 
         for i in range(5):
             r_layout = QHBoxLayout()
             r_layout.addWidget(QLabel(self.app.tr("effective_substat_n", i + 1)))
 
             cb = QComboBox()
-            cb.addItems([""] + self.substat_candidates)  # Add empty option
+            cb.setModel(substat_model)
             self.eff_combos.append(cb)
             r_layout.addWidget(cb)
 
@@ -242,17 +291,7 @@ class CharSettingDialog(QDialog):
         # key = str(c) if single, else f"{c}_{occurrence}"
 
         # We need to replicate the key generation logic to match slots
-        costs = self.cost_presets.get(self.combo_preset.currentText(), [])
-        cost_occurrence = {}
-        cost_total = {c: costs.count(c) for c in set(costs)}
-
-        for i, cost in enumerate(costs):
-            cost_occurrence[cost] = cost_occurrence.get(cost, 0) + 1
-            if cost_total[cost] == 1:
-                key = str(cost)
-            else:
-                key = f"{cost}_{cost_occurrence[cost]}"
-
+        for i, key in enumerate(PRESET_SLOT_KEYS.get(self.combo_preset.currentText(), ())):
             val = self.profile.main_stats.get(key, "")
             idx = self.slot_combos[i].findText(val)
             if idx >= 0:
@@ -261,39 +300,71 @@ class CharSettingDialog(QDialog):
         # Weights
         # Map back to UI slots. The logic is a bit flexible here since UI is 5 fixed slots.
         # We just fill as many as fit.
-        sorted_weights = sorted(self.profile.weights.items(), key=lambda x: x[1], reverse=True)
-        for i, (stat, weight) in enumerate(sorted_weights):
-            if i < 5:
-                idx = self.eff_combos[i].findText(stat)
-                if idx >= 0:
-                    self.eff_combos[i].setCurrentIndex(idx)
-                    self.eff_weights[i].setText(str(weight))
+        top_weights = heapq.nlargest(5, self.profile.weights.items(), key=itemgetter(1))
+        for i, (stat, weight) in enumerate(top_weights):
+            idx = self._substat_index.get(stat, -1)
+            if idx >= 0:
+                self.eff_combos[i].setCurrentIndex(idx)
+                self.eff_weights[i].setText(str(weight))
 
     def update_main_stat_options(self, *args):
         preset_key = self.combo_preset.currentText()
         if not preset_key:
             return
 
-        costs = self.cost_presets[preset_key]
-        for i, cost in enumerate(costs):
-            cb = self.slot_combos[i]
-            cb.clear()
-            vals = self.main_stats.get(str(cost), [""])
+        self.setUpdatesEnabled(False)
+        try:
+            # Swapping in prebuilt models replaces clear() + addItems(); unused slots get an empty model
+            for combo, label, (model, label_text) in zip(
+                self.slot_combos, self.slot_labels, self._get_preset_slots(preset_key)
+            ):
+                combo.setModel(model)
+                label.setText(label_text)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    @classmethod
+    def _get_substat_model(cls, max_values: dict) -> QStringListModel:
+        """Returns the effective-stat options model, shared by every combo of every dialog for the same data."""
+        if cls._substat_model_source is not max_values:
             # Add empty option at the beginning
-            cb.addItems([""] + vals)
-
-            self.slot_labels[i].setText(self.app.tr("cost_echo", cost))
-
-        # Clear remaining
-        for j in range(len(costs), 5):
-            self.slot_combos[j].clear()
-            self.slot_labels[j].setText("")
+            cls._substat_model = QStringListModel([""] + list(max_values.keys()))
+            cls._substat_model_source = max_values
+        return cls._substat_model
+
+    def _get_preset_slots(self, preset_key: str) -> List[Tuple[QStringListModel, str]]:
+        """Returns (options model, label text) for all five slots of a preset, built on first use."""
+        slots = self._preset_slots.get(preset_key)
+        if slots is None:
+            tr = self.app.tr
+            costs = self.cost_presets[preset_key]
+            slots = [(self._get_main_stat_model(str(cost)), tr("cost_echo", cost)) for cost in costs]
+            slots += [(self._get_main_stat_model(""), "")] * (5 - len(costs))
+            self._preset_slots[preset_key] = slots
+        return slots
+
+    def _get_main_stat_model(self, cost: str) -> QStringListModel:
+        model = self._main_stat_models.get(cost)
+        if model is None:
+            # Add empty option at the beginning; an unused slot has no options at all
+            items = [""] + self.main_stats.get(cost, [""]) if cost else []
+            model = QStringListModel(items, self)
+            self._main_stat_models[cost] = model
+        return model
 
     def _apply_weight_template(self, template_name):
         if template_name == self.app.tr("custom") or template_name not in self.weight_templates:
             return
 
-        weights = self.weight_templates[template_name]
+        slots = self._template_slots.get(template_name)
+        if slots is None:
+            slots = []
+            for i, (stat_name, weight_value) in enumerate(self.weight_templates[template_name].items()):
+                if i < 5:
+                    index = self._substat_index.get(stat_name, -1)
+                    if index != -1:
+                        slots.append((i, index, str(weight_value)))
+            self._template_slots[template_name] = slots
 
         # Disable signals to prevent feedback loops while updating
         for combo in self.eff_combos:
@@ -307,12 +378,9 @@ class CharSettingDialog(QDialog):
             self.eff_weights[i].setText("")
 
         # Apply template
-        for i, (stat_name, weight_value) in enumerate(weights.items()):
-            if i < 5:
-                index = self.eff_combos[i].findText(stat_name)
-                if index != -1:
-                    self.eff_combos[i].setCurrentIndex(index)
-                    self.eff_weights[i].setText(str(weight_value))
+        for i, index, weight_text in slots:
+            self.eff_combos[i].setCurrentIndex(index)
+            self.eff_weights[i].setText(weight_text)
 
         # Re-enable signals
         for combo in self.eff_combos:
@@ -332,18 +400,8 @@ class CharSettingDialog(QDialog):
             return
 
         preset_key = self.combo_preset.currentText()
-        costs = self.cost_presets[preset_key]
         mainstats = {}
-        cost_occurrence = {}
-        cost_total = {c: costs.count(c) for c in set(costs)}
-
-        for i, c in enumerate(costs):
-            cost_occurrence[c] = cost_occurrence.get(c, 0) + 1
-            if cost_total[c] == 1:
-                key = str(c)
-            else:
-                key = f"{c}_{cost_occurrence[c]}"
-
+        for i, key in enumerate(PRESET_SLOT_KEYS[preset_key]):
             mainstat = self.slot_combos[i].currentText()
             if not mainstat:
                 QMessageBox.critical(self, self.app.tr("error"), self.app.tr("echo_main_stat_unselected", i + 1))
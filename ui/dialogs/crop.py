@@ -1,15 +1,45 @@
-from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QRubberBand, QMessageBox
-from PySide6.QtCore import Qt, QRect, QSize, QPoint
-from PySide6.QtGui import QPixmap
-from utils.constants import DIALOG_CROP_WIDTH, DIALOG_CROP_HEIGHT
+import json
+import os
+import re
+import tempfile
+import weakref
+from collections import OrderedDict
+from typing import Optional
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QRubberBand, QMessageBox, QCheckBox, QComboBox, QLineEdit
+)
+from PySide6.QtCore import Qt, QRect, QSize, QPoint, QTimer, QStringListModel
+from PySide6.QtGui import QImage, QPixmap, QTransform
+from utils.constants import DIALOG_CROP_WIDTH, DIALOG_CROP_HEIGHT, CROP_PREVIEW_CACHE_SIZE
 
 try:
-    from PIL import Image, ImageQt
+    from PIL import Image
 
     is_pil_installed = True
 except ImportError:
     is_pil_installed = False
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+# Drag updates to the rubber band are applied at most once per frame (~60 Hz)
+RUBBER_BAND_UPDATE_MS = 16
+
+# (id(image), width, height) -> (weakref to the source image, preview pixmap); oldest entry evicted first
+_preview_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
 
 class CropLabel(QLabel):
     """QLabel with rubber band selection."""
@@ -20,6 +50,11 @@ class CropLabel(QLabel):
         self.origin = QPoint()
         self.current_rect = QRect()
         self.is_selecting = False
+        self._pending_pos: Optional[QPoint] = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(RUBBER_BAND_UPDATE_MS)
+        self._update_timer.timeout.connect(self._flush_rubber_band)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -30,10 +65,20 @@ class CropLabel(QLabel):
 
     def mouseMoveEvent(self, event):
         if self.is_selecting:
-            self.rubberBand.setGeometry(QRect(self.origin, event.pos()).normalized())
+            # Coalesce moves: only the latest position is applied when the timer fires
+            self._pending_pos = event.pos()
+            if not self._update_timer.isActive():
+                self._update_timer.start()
+
+    def _flush_rubber_band(self):
+        if self._pending_pos is not None:
+            self.rubberBand.setGeometry(QRect(self.origin, self._pending_pos).normalized())
+            self._pending_pos = None
 
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
+            self._update_timer.stop()
+            self._flush_rubber_band()
             self.is_selecting = False
             self.current_rect = self.rubberBand.geometry()
 
@@ -55,12 +100,12 @@ class CropDialog(QDialog):
         self.percent_label = None
         self.confirm_checkbox = None
         self.last_percent = None
+        self._last_rect = None
+        self.presets = []
+        self._presets_dirty = False
         self.init_ui()
 
     def init_ui(self):
-        import os
-        from PySide6.QtWidgets import QCheckBox, QComboBox, QLineEdit
-
         layout = QVBoxLayout(self)
         layout.addWidget(QLabel(self.app.tr("crop_instruction")))
 
@@ -94,6 +139,8 @@ class CropDialog(QDialog):
         self.preset_combo = QComboBox()
         self.preset_combo.setEditable(False)
         self.preset_combo.setMinimumWidth(120)
+        self._preset_model = QStringListModel(self)
+        self.preset_combo.setModel(self._preset_model)
         self.preset_name_input = QLineEdit()
         self.preset_name_input.setPlaceholderText(self.app.tr("preset_name_placeholder"))
         self.preset_input = QLineEdit()
@@ -116,8 +163,9 @@ class CropDialog(QDialog):
         self.save_as_default_checkbox.setToolTip(self.app.tr("crop_save_as_default_tooltip"))
         layout.addWidget(self.save_as_default_checkbox)
 
-        self._preset_file = os.path.join(os.path.dirname(__file__), "..", "crop_presets.json")
-        self._load_presets()
+        self._preset_file = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "crop_presets.json"))
+        # Read presets once the event loop is running so the file access does not delay opening the dialog
+        QTimer.singleShot(0, self, self._load_presets)
         btn_save.clicked.connect(self._save_preset)
         btn_load.clicked.connect(self._apply_preset)
         btn_delete.clicked.connect(self._delete_preset)
@@ -150,33 +198,52 @@ class CropDialog(QDialog):
         btn_layout.addWidget(btn_cancel)
         layout.addLayout(btn_layout)
 
-    def _load_presets(self):
-        import json
-        import os
-
-        self.presets = []
+    def _read_preset_file(self) -> dict:
         try:
-            preset_path = os.path.abspath(self._preset_file)
-            if os.path.exists(preset_path):
-                with open(preset_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.presets = data.get("crop_presets", [])
+            with open(self._preset_file, "rb", buffering=65536) as f:
+                return _json_loads(f.read())
         except Exception:
-            self.presets = []
-        self.preset_combo.clear()
-        for p in self.presets:
-            self.preset_combo.addItem(p.get("name", f"{p['w']}x{p['h']}"))
+            return {}
 
-    def _save_presets_to_file(self):
-        import json
-        import os
+    def _load_presets(self):
+        self.presets = self._read_preset_file().get("crop_presets", [])
+        self._refresh_preset_combo()
+
+    def _refresh_preset_combo(self):
+        # Swap the whole list in one model reset; repopulating must not overwrite the L,T,W,H inputs
+        self.preset_combo.blockSignals(True)
+        self._preset_model.setStringList([p.get("name", f"{p['w']}x{p['h']}") for p in self.presets])
+        self.preset_combo.blockSignals(False)
+
+    def _write_preset_file(self, data: dict):
+        """Serializes in one buffer and swaps the file in atomically so a crash never leaves it half-written."""
+        payload = _json_dumps(data)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self._preset_file), suffix=".tmp")
+        try:
+            with open(fd, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._preset_file)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
 
+    def _save_presets_to_file(self):
+        # Keep other keys in the file (e.g. default_crop written by _ok)
+        data = self._read_preset_file()
+        data["crop_presets"] = self.presets
         try:
-            preset_path = os.path.abspath(self._preset_file)
-            with open(preset_path, "w", encoding="utf-8") as f:
-                json.dump({"crop_presets": self.presets}, f, ensure_ascii=False, indent=2)
+            self._write_preset_file(data)
         except Exception:
             pass
+        self._presets_dirty = False
+
+    def done(self, result):
+        # Preset edits are written once when the dialog closes (accept, reject or window close)
+        if self._presets_dirty:
+            self._save_presets_to_file()
+        super().done(result)
 
     def _save_preset(self):
         text = self.preset_input.text().strip()
@@ -191,8 +258,6 @@ class CropDialog(QDialog):
         else:
             try:
                 # Support both comma and 'x' separators for flexibility
-                import re
-
                 vals = [float(v.strip().replace("%", "")) for v in re.split(r"[,x]", text)]
 
                 if len(vals) == 4:
@@ -209,8 +274,8 @@ class CropDialog(QDialog):
                 return
 
         self.presets.append({"name": name, "l": l, "t": t, "w": w, "h": h})
-        self._save_presets_to_file()
-        self._load_presets()
+        self._presets_dirty = True
+        self._refresh_preset_combo()
 
     def _apply_preset(self):
         idx = self.preset_combo.currentIndex()
@@ -223,23 +288,23 @@ class CropDialog(QDialog):
         l = preset.get("l", (100.0 - w) / 2)
         t = preset.get("t", (100.0 - h) / 2)
 
-        img_w, img_h = self.pil_image.size
-
-        # Convert percentages to original pixels
-        orig_l = int(img_w * l / 100.0)
-        orig_t = int(img_h * t / 100.0)
-        orig_w = int(img_w * w / 100.0)
-        orig_h = int(img_h * h / 100.0)
-
-        # Scale for display
-        l_s = int(orig_l * self.scale_ratio)
-        t_s = int(orig_t * self.scale_ratio)
-        w_s = int(orig_w * self.scale_ratio)
-        h_s = int(orig_h * self.scale_ratio)
-
-        self.image_label.rubberBand.setGeometry(QRect(l_s, t_s, w_s, h_s))
+        self._show_selection(self._percent_to_display_rect(l, t, w, h))
+
+    def _percent_to_display_rect(self, left_p, top_p, width_p, height_p) -> QRect:
+        """Converts L/T/W/H percentages to a rect in preview coordinates (via whole original pixels)."""
+        img_w, img_h = self._img_w, self._img_h
+        ratio = self.scale_ratio
+        return QRect(
+            int(int(img_w * left_p / 100.0) * ratio),
+            int(int(img_h * top_p / 100.0) * ratio),
+            int(int(img_w * width_p / 100.0) * ratio),
+            int(int(img_h * height_p / 100.0) * ratio),
+        )
+
+    def _show_selection(self, rect: QRect):
+        self.image_label.rubberBand.setGeometry(rect)
         self.image_label.rubberBand.show()
-        self.image_label.current_rect = QRect(l_s, t_s, w_s, h_s)
+        self.image_label.current_rect = rect
         self._update_percent_label()
 
     def _delete_preset(self):
@@ -247,8 +312,8 @@ class CropDialog(QDialog):
         if idx < 0 or idx >= len(self.presets):
             return
         del self.presets[idx]
-        self._save_presets_to_file()
-        self._load_presets()
+        self._presets_dirty = True
+        self._refresh_preset_combo()
 
     def _preset_combo_changed(self, idx):
         if idx < 0 or idx >= len(self.presets):
@@ -272,24 +337,22 @@ class CropDialog(QDialog):
 
     def _update_percent_label(self):
         rect = self.image_label.get_selection()
+        # Releasing on the same selection again must not clobber a value typed into the preset field
+        rect_key = rect.getRect()
+        if rect_key == self._last_rect:
+            return
+        self._last_rect = rect_key
         if rect.isEmpty():
             self.percent_label.setText("")
             self.last_percent = None
             return
 
-        img_w, img_h = self.pil_image.size
-
-        # Calculate original coordinates (reversing display scale)
-        orig_l = rect.x() / self.scale_ratio
-        orig_t = rect.y() / self.scale_ratio
-        orig_w = rect.width() / self.scale_ratio
-        orig_h = rect.height() / self.scale_ratio
-
-        # Convert to percentages
-        p_l = orig_l / img_w * 100.0
-        p_t = orig_t / img_h * 100.0
-        p_w = orig_w / img_w * 100.0
-        p_h = orig_h / img_h * 100.0
+        # Preview pixels -> percentages of the original image
+        px_x, px_y = self._percent_per_px
+        p_l = rect.x() * px_x
+        p_t = rect.y() * px_y
+        p_w = rect.width() * px_x
+        p_h = rect.height() * px_y
 
         self.last_percent = (p_l, p_t, p_w, p_h)
         self.percent_label.setText(f"L:{p_l:.1f}% T:{p_t:.1f}% W:{p_w:.1f}% H:{p_h:.1f}%")
@@ -308,20 +371,52 @@ class CropDialog(QDialog):
         scale_w = max_w / w
         scale_h = max_h / h
         self.scale_ratio = min(scale_w, scale_h, 1.0)
+        # Fixed for the dialog's lifetime; reused by every selection <-> percentage conversion
+        self._img_w, self._img_h = w, h
+        self._percent_per_px = (100.0 / (w * self.scale_ratio), 100.0 / (h * self.scale_ratio))
 
         new_w = int(w * self.scale_ratio)
         new_h = int(h * self.scale_ratio)
 
-        # Ensure image is in a display-friendly mode and loaded
-        if self.pil_image.mode != "RGBA" and self.pil_image.mode != "RGB":
+        # Reopening the dialog on the same image reuses its preview
+        cache_key = (id(self.pil_image), new_w, new_h)
+        cached = _preview_cache.get(cache_key)
+        if cached is not None and cached[0]() is self.pil_image:
+            self.image_label.setPixmap(cached[1])
+            self.image_label.setFixedSize(new_w, new_h)
+            return
+
+        # Ensure image is in a display-friendly mode and loaded; only keep 4 bytes/pixel when there is alpha
+        mode = self.pil_image.mode
+        if mode == "RGBA" or mode == "RGB":
+            display_img = self.pil_image
+        elif mode in ("LA", "La", "PA", "RGBa") or (mode == "P" and "transparency" in self.pil_image.info):
             display_img = self.pil_image.convert("RGBA")
         else:
-            display_img = self.pil_image
+            display_img = self.pil_image.convert("RGB")
 
-        resized = display_img.resize((new_w, new_h), Image.Resampling.LANCZOS)
-        self.qim = ImageQt.ImageQt(resized)
+        if (new_w, new_h) == display_img.size:
+            resized = display_img
+        else:
+            # Mild downscales look the same with cheaper filters; LANCZOS is kept for heavy reductions
+            if self.scale_ratio > 0.5:
+                resample = Image.Resampling.BILINEAR
+            elif self.scale_ratio > 0.25:
+                resample = Image.Resampling.BOX
+            else:
+                resample = Image.Resampling.LANCZOS
+            # Box-reduce by an integer factor first so the filter only runs on a near-final-size image
+            resized = display_img.resize((new_w, new_h), resample, reducing_gap=2.0)
+        # Wrap the raw RGB(A) bytes directly instead of ImageQt's BGRA repacking; keep them alive with the QImage
+        self._qim_data = resized.tobytes()
+        fmt = QImage.Format.Format_RGBA8888 if resized.mode == "RGBA" else QImage.Format.Format_RGB888
+        self.qim = QImage(self._qim_data, new_w, new_h, len(self._qim_data) // new_h, fmt)
         pixmap = QPixmap.fromImage(self.qim)
 
+        _preview_cache[cache_key] = (weakref.ref(self.pil_image), pixmap)
+        while len(_preview_cache) > CROP_PREVIEW_CACHE_SIZE:
+            _preview_cache.popitem(last=False)
+
         self.image_label.setPixmap(pixmap)
         self.image_label.setFixedSize(new_w, new_h)
 
@@ -334,27 +429,7 @@ class CropDialog(QDialog):
             width_p = float(self.app.crop_width_percent_var)
             height_p = float(self.app.crop_height_percent_var)
 
-            img_w, img_h = self.pil_image.size
-
-            # Convert percentages to original pixels
-            orig_l = int(img_w * left_p / 100.0)
-            orig_t = int(img_h * top_p / 100.0)
-            orig_w = int(img_w * width_p / 100.0)
-            orig_h = int(img_h * height_p / 100.0)
-
-            # Convert to display scale
-            l_s = int(orig_l * self.scale_ratio)
-            t_s = int(orig_t * self.scale_ratio)
-            w_s = int(orig_w * self.scale_ratio)
-            h_s = int(orig_h * self.scale_ratio)
-
-            self.image_label.rubberBand.setGeometry(QRect(l_s, t_s, w_s, h_s))
-            self.image_label.rubberBand.show()
-            self.image_label.current_rect = QRect(l_s, t_s, w_s, h_s)
-
-            # Update labels and input fields
-            self._update_percent_label()
-
+            self._show_selection(self._percent_to_display_rect(left_p, top_p, width_p, height_p))
         except Exception as e:
             # Fallback if values are invalid
             self.app.logger.debug(f"Failed to apply current crop settings to dialog: {e}")
@@ -365,9 +440,6 @@ class CropDialog(QDialog):
         self._update_percent_label()
 
     def _ok(self):
-        import json
-        import os
-
         if self.confirm_checkbox and not self.confirm_checkbox.isChecked():
             QMessageBox.information(self, self.app.tr("info"), self.app.tr("crop_confirm_needed"))
             return
@@ -417,22 +489,14 @@ class CropDialog(QDialog):
                 self.app.config_manager.save()
 
                 # Also keep saving to crop_presets.json for dialog-specific defaults
-                preset_path = os.path.abspath(self._preset_file)
-                data = {}
-                if os.path.exists(preset_path):
-                    with open(preset_path, "r", encoding="utf-8") as f:
-                        try:
-                            data = json.load(f)
-                        except Exception:
-                            data = {}
+                data = self._read_preset_file()
                 data["default_crop"] = {
                     "left_p": float(left_p),
                     "top_p": float(top_p),
                     "width_p": float(width_p),
                     "height_p": float(height_p),
                 }
-                with open(preset_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                self._write_preset_file(data)
             except Exception:
                 # Fail silently; not critical
                 pass
@@ -448,29 +512,19 @@ class CropDialog(QDialog):
             self.accept()
             return
 
-        # Convert coords (from displayed scaled image back to original image coords)
-        x1 = rect.x()
-        y1 = rect.y()
-        x2 = rect.right()
-        y2 = rect.bottom()
-
-        orig_left = int(x1 / self.scale_ratio)
-        orig_top = int(y1 / self.scale_ratio)
-        orig_right = int(x2 / self.scale_ratio)
-        orig_bottom = int(y2 / self.scale_ratio)
-
-        # Limit to image bounds
-        orig_left = max(0, orig_left)
-        orig_top = max(0, orig_top)
-        orig_right = min(self.pil_image.size[0], orig_right)
-        orig_bottom = min(self.pil_image.size[1], orig_bottom)
+        # Map the preview selection back to original image pixels and clip it to the image
+        inv = 1.0 / self.scale_ratio
+        orig = QTransform.fromScale(inv, inv).mapRect(rect).intersected(QRect(0, 0, self._img_w, self._img_h))
+        orig_left, orig_top = orig.left(), orig.top()
+        # QRect right()/bottom() are inclusive; the crop box edges are exclusive
+        orig_right, orig_bottom = orig.right() + 1, orig.bottom() + 1
 
-        if (orig_right - orig_left) < 5 or (orig_bottom - orig_top) < 5:
+        if orig.width() < 5 or orig.height() < 5:
             QMessageBox.warning(self, self.app.tr("warning"), self.app.tr("crop_too_small"))
             return
 
         if self.percent_apply_checkbox and self.percent_apply_checkbox.isChecked():
-            img_w, img_h = self.pil_image.size
+            img_w, img_h = self._img_w, self._img_h
             left_p = orig_left / img_w * 100.0
             top_p = orig_top / img_h * 100.0
             width_p = (orig_right - orig_left) / img_w * 100.0
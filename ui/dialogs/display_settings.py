@@ -7,14 +7,14 @@ and element-based accent coloring.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QComboBox, QCheckBox, QMessageBox, QColorDialog, QRadioButton, 
     QButtonGroup, QGroupBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QColor, QFontDatabase
 
 if TYPE_CHECKING:
@@ -24,6 +24,9 @@ if TYPE_CHECKING:
 class DisplaySettingsDialog(QDialog):
     """Visual settings dialog focused on themes and accent colors."""
 
+    # (font families fingerprint, sorted Japanese-capable families), shared across instances
+    _compatible_fonts_cache: Optional[Tuple[Tuple[str, ...], List[str]]] = None
+
     def __init__(self, parent: ScoreCalculatorApp):
         super().__init__(parent)
         self.app = parent
@@ -108,10 +111,8 @@ class DisplaySettingsDialog(QDialog):
         font_layout.addWidget(QLabel(self.app.tr("font_settings")))
         self.combo_font = QComboBox()
         self.combo_font.addItem(self.app.tr("default_font"))
-        fonts = self._get_compatible_fonts()
-        self.combo_font.addItems(fonts)
-        if self.selected_font in fonts:
-            self.combo_font.setCurrentText(self.selected_font)
+        # Font enumeration is the slowest part of building this dialog; fill the list once it is shown
+        QTimer.singleShot(0, self, self._populate_fonts)
         font_layout.addWidget(self.combo_font)
         misc_layout.addLayout(font_layout)
 
@@ -133,6 +134,12 @@ class DisplaySettingsDialog(QDialog):
         btn_box.addWidget(btn_apply)
         layout.addLayout(btn_box)
 
+    def _populate_fonts(self) -> None:
+        fonts = self._get_compatible_fonts()
+        self.combo_font.addItems(fonts)
+        if self.selected_font in fonts:
+            self.combo_font.setCurrentText(self.selected_font)
+
     def _update_preview(self, lbl: QLabel, color: str) -> None:
         lbl.setStyleSheet(f"background-color: {color}; border: 1px solid gray;")
 
@@ -145,16 +152,28 @@ class DisplaySettingsDialog(QDialog):
     def _apply_settings(self) -> None:
         """Save settings and apply theme."""
         config = self.app.app_config
+        before = self._settings_snapshot(config)
         config.theme = "light" if self.rb_light.isChecked() else "dark"
         config.accent_mode = "custom" if self.rb_acc_custom.isChecked() else "auto"
         config.custom_accent_color = self.selected_custom_accent
         config.app_font = "" if self.combo_font.currentIndex() == 0 else self.combo_font.currentText()
         config.transparent_frames = self.cb_trans.isChecked()
-        
-        self.app.apply_theme(config.theme)
-        self.app.refresh_results_display()
+
+        if self._settings_snapshot(config) != before:
+            # Restyle with painting suspended so the window repaints once; apply_theme also refreshes results
+            self.app.setUpdatesEnabled(False)
+            try:
+                self.app.apply_theme(config.theme)
+            finally:
+                self.app.setUpdatesEnabled(True)
         self.accept()
 
+    @staticmethod
+    def _settings_snapshot(config) -> tuple:
+        return (
+            config.theme, config.accent_mode, config.custom_accent_color, config.app_font, config.transparent_frames
+        )
+
     def _full_reset(self) -> None:
         if QMessageBox.question(self, self.app.tr("full_reset"), 
                                 self.app.tr("confirm_full_reset")) == QMessageBox.Yes:
@@ -164,7 +183,13 @@ class DisplaySettingsDialog(QDialog):
             self.cb_trans.setChecked(False)
             self._apply_settings()
 
-    def _get_compatible_fonts(self) -> List[str]:
-        db = QFontDatabase()
-        compatible = [f for f in db.families() if QFontDatabase.WritingSystem.Japanese in db.writingSystems(f)]
-        return sorted(compatible)
\ No newline at end of file
+    @classmethod
+    def _get_compatible_fonts(cls) -> List[str]:
+        # Querying writing systems per family is slow on Windows; recompute only when the family list changes
+        families = tuple(QFontDatabase.families())
+        if cls._compatible_fonts_cache is None or cls._compatible_fonts_cache[0] != families:
+            writing_systems = QFontDatabase.writingSystems
+            japanese = QFontDatabase.WritingSystem.Japanese
+            compatible = sorted(f for f in families if japanese in writing_systems(f))
+            cls._compatible_fonts_cache = (families, compatible)
+        return list(cls._compatible_fonts_cache[1])
\ No newline at end of file
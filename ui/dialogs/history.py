@@ -2,8 +2,7 @@ from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QLineEdit,
     QLabel,
@@ -13,7 +12,62 @@ from PySide6.QtWidgets import (
     QComboBox,
     QCheckBox,
 )
-from PySide6.QtCore import QDate
+from PySide6.QtCore import QDate, Qt, QAbstractTableModel, QModelIndex, QTimer
+
+from utils.constants import TIMER_HISTORY_FILTER_INTERVAL
+
+
+class HistoryTableModel(QAbstractTableModel):
+    """Read-only table over filtered history entries; cell text is produced only for visible rows."""
+
+    COLUMN_COUNT = 5
+
+    def __init__(self, headers, display_name, parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._display_name = display_name
+        self._rows = []
+        self._char_display_cache = {}
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        h = self._rows[index.row()]
+        column = index.column()
+        if column == 0:
+            return h.timestamp
+        if column == 1:
+            return self.char_display(h.character)
+        if column == 2:
+            return h.cost
+        if column == 3:
+            return h.action
+        return h.result
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def char_display(self, character):
+        """Returns "JP (EN)" for a character id, formatted once per distinct character."""
+        text = self._char_display_cache.get(character)
+        if text is None:
+            jp_name = self._display_name(character)
+            text = f"{jp_name} ({character})" if jp_name != character else character
+            self._char_display_cache[character] = text
+        return text
 
 
 class HistoryDialog(QDialog):
@@ -33,6 +87,24 @@ class HistoryDialog(QDialog):
     def init_ui(self):
         layout = QVBoxLayout(self)
 
+        # Typing and date stepping fire per keystroke/click; filter once they pause
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(TIMER_HISTORY_FILTER_INTERVAL)
+        self._filter_timer.timeout.connect(self.load_data)
+
+        self.model = HistoryTableModel(
+            [
+                self.app.tr("history_col_time"),
+                self.app.tr("history_col_char"),
+                self.app.tr("history_col_cost"),
+                self.app.tr("history_col_action"),
+                self.app.tr("history_col_result"),
+            ],
+            self.app.character_manager.get_display_name,
+            self,
+        )
+
         # Filter Area
         filter_frame = QFrame()
         filter_layout = QHBoxLayout(filter_frame)
@@ -41,7 +113,7 @@ class HistoryDialog(QDialog):
         filter_layout.addWidget(QLabel(self.app.tr("history_search")))
         self.kw_input = QLineEdit()
         self.kw_input.setPlaceholderText("Action, Result, Character...")
-        self.kw_input.textChanged.connect(self.load_data)
+        self.kw_input.textChanged.connect(self._schedule_load_data)
         filter_layout.addWidget(self.kw_input)
 
         # Character Filter
@@ -49,11 +121,9 @@ class HistoryDialog(QDialog):
         self.char_filter = QComboBox()
         self.char_filter.addItem("All", "")
         # Get all unique characters in history
-        chars = sorted(list(set(h.character for h in self.history_mgr._history if h.character)))
+        chars = sorted(set(h.character for h in self.history_mgr._history if h.character))
         for c in chars:
-            jp_name = self.app.character_manager.get_display_name(c)
-            display_text = f"{jp_name} ({c})" if jp_name != c else c
-            self.char_filter.addItem(display_text, c)
+            self.char_filter.addItem(self.model.char_display(c), c)
         self.char_filter.currentIndexChanged.connect(self.load_data)
         filter_layout.addWidget(self.char_filter)
 
@@ -81,14 +151,14 @@ class HistoryDialog(QDialog):
         self.date_from = QDateEdit()
         self.date_from.setCalendarPopup(True)
         self.date_from.setDate(QDate.currentDate().addMonths(-1))
-        self.date_from.dateChanged.connect(self.load_data)
+        self.date_from.dateChanged.connect(self._schedule_load_data)
         filter_layout.addWidget(self.date_from)
 
         filter_layout.addWidget(QLabel(self.app.tr("history_to")))
         self.date_to = QDateEdit()
         self.date_to.setCalendarPopup(True)
         self.date_to.setDate(QDate.currentDate())
-        self.date_to.dateChanged.connect(self.load_data)
+        self.date_to.dateChanged.connect(self._schedule_load_data)
         filter_layout.addWidget(self.date_to)
 
         btn_reset = QPushButton(self.app.tr("history_reset"))
@@ -103,17 +173,8 @@ class HistoryDialog(QDialog):
         layout.addWidget(self.stats_label)
 
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(
-            [
-                self.app.tr("history_col_time"),
-                self.app.tr("history_col_char"),
-                self.app.tr("history_col_cost"),
-                self.app.tr("history_col_action"),
-                self.app.tr("history_col_result"),
-            ]
-        )
+        self.table = QTableView()
+        self.table.setModel(self.model)
 
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
@@ -122,8 +183,8 @@ class HistoryDialog(QDialog):
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)
 
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         layout.addWidget(self.table)
 
         # Bottom Buttons
@@ -169,7 +230,11 @@ class HistoryDialog(QDialog):
             self.app.app_config.history_duplicate_mode = new_mode
             self.app.config_manager.save()
 
+    def _schedule_load_data(self, *args):
+        self._filter_timer.start()
+
     def load_data(self):
+        self._filter_timer.stop()
         kw = self.kw_input.text()
         char = self.char_filter.currentData()
         cost = self.cost_filter.currentText()
@@ -190,20 +255,9 @@ class HistoryDialog(QDialog):
         name_map = self.app.character_manager._name_map_en_to_jp
         entries = self.history_mgr.get_entries(kw, char, cost, d_from, d_to, name_map=name_map, rating=rating)
 
-        self.table.setRowCount(0)
+        self.model.set_rows(entries)
         scores = []
-        for i, h in enumerate(entries):
-            self.table.insertRow(i)
-            self.table.setItem(i, 0, QTableWidgetItem(h.timestamp))
-
-            jp_name = self.app.character_manager.get_display_name(h.character)
-            char_display = f"{jp_name} ({h.character})" if jp_name != h.character else h.character
-            self.table.setItem(i, 1, QTableWidgetItem(char_display))
-
-            self.table.setItem(i, 2, QTableWidgetItem(h.cost))
-            self.table.setItem(i, 3, QTableWidgetItem(h.action))
-            self.table.setItem(i, 4, QTableWidgetItem(h.result))
-
+        for h in entries:
             # Extract score for stats
             score = h.details.get("score")
             if score is None:
@@ -25,6 +25,21 @@ class ImagePreprocessingSettingsDialog(QDialog):
         ocr_layout = QVBoxLayout(ocr_group)
 
         # Engine selection removed - only Pillow is used now
+        from PySide6.QtWidgets import QCheckBox
+
+        self.cb_downscale = QCheckBox(
+            self.app.tr("ocr_downscale_large")
+            if self.app.tr("ocr_downscale_large") != "ocr_downscale_large"
+            else "Downscale large images before OCR (faster)"
+        )
+        self.cb_downscale.setChecked(self.app.app_config.ocr_downscale_large)
+        self.cb_downscale.setToolTip(
+            self.app.tr("tooltip_ocr_downscale_large")
+            if self.app.tr("tooltip_ocr_downscale_large") != "tooltip_ocr_downscale_large"
+            else "Shrinks images whose longer side is very large before passing them to Tesseract.\n"
+            "Speeds up OCR on high-resolution screenshots."
+        )
+        ocr_layout.addWidget(self.cb_downscale)
 
         layout.addWidget(ocr_group)
 
@@ -34,8 +49,6 @@ class ImagePreprocessingSettingsDialog(QDialog):
         )
         behavior_layout = QVBoxLayout(behavior_group)
 
-        from PySide6.QtWidgets import QCheckBox
-
         self.cb_skip_duplicate = QCheckBox(
             self.app.tr("skip_duplicate_ocr")
             if self.app.tr("skip_duplicate_ocr") != "skip_duplicate_ocr"
@@ -68,5 +81,6 @@ class ImagePreprocessingSettingsDialog(QDialog):
 
     def _apply_settings(self):
         self.app.app_config.skip_duplicate_ocr = self.cb_skip_duplicate.isChecked()
+        self.app.app_config.ocr_downscale_large = self.cb_downscale.isChecked()
         self.app.config_manager.save()
         self.accept()
@@ -4,6 +4,10 @@ from PySide6.QtWidgets import QMessageBox
 from PySide6.QtCore import QTimer
 from utils.constants import TIMER_SAVE_CONFIG_INTERVAL
 
+# Order cycled by the theme shortcut, as a precomputed "current -> next" lookup
+THEME_CYCLE = ("dark", "light", "clear")
+_NEXT_THEME = {theme: THEME_CYCLE[(i + 1) % len(THEME_CYCLE)] for i, theme in enumerate(THEME_CYCLE)}
+
 class ConfigHandler(BaseHandler):
     """Handles application settings, localization, and theme changes."""
     
@@ -117,9 +121,8 @@ class ConfigHandler(BaseHandler):
         elif obj_name == "slider_crop_h": self.ui.entry_crop_h.setText(str(value))
 
     def cycle_theme(self) -> None:
-        themes = ["dark", "light", "clear"]
         current = self.app.ctx.theme_manager.get_current_theme()
-        new_theme = themes[(themes.index(current) + 1) % len(themes)] if current in themes else "dark"
+        new_theme = _NEXT_THEME.get(current, "dark")
         self.app.ctx.theme_manager.apply_theme(new_theme)
         self.config_manager.update_app_setting('theme', new_theme)
         self.save_config()
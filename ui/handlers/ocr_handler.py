@@ -1,3 +1,4 @@
+import os
 from typing import Any
 from ui.handlers.base import BaseHandler
 from PySide6.QtWidgets import QMessageBox, QFileDialog
@@ -11,6 +12,7 @@ class OCRHandler(BaseHandler):
         self._ocr_trigger_character = None
         self._temp_ocr_result = None
         self._batch_assigned_tabs = []
+        self._last_image_dir = ""
 
     def on_ocr_completed(self, result: Any) -> None:
         ocr_data = result if isinstance(result, OCRResult) else result.result
@@ -86,12 +88,15 @@ class OCRHandler(BaseHandler):
     def import_image(self) -> None:
         self.app.check_character_selected(quiet=False)
         self._ocr_trigger_character = self.app.character_var
+        # Reopen in the last used folder rather than enumerating the working directory each time
         file_paths, _ = QFileDialog.getOpenFileNames(
-            self.app, self.app.tr("select_image_file"), "",
+            self.app, self.app.tr("select_image_file"), self._last_image_dir,
             f"{self.app.tr('image_files')} (*.png *.jpg *.jpeg *.bmp *.gif);;"
-            f"{self.app.tr('all_files')} (*.*)"
+            f"{self.app.tr('all_files')} (*.*)",
+            options=QFileDialog.Option.ReadOnly
         )
         if file_paths:
+            self._last_image_dir = os.path.dirname(file_paths[0])
             if len(file_paths) > 5:
                 QMessageBox.warning(
                     self.app, self.app.tr("info"),
@@ -289,9 +289,8 @@ class HtmlRenderer:
                 html += f"<b>{self.tr('achievement_calc_title')}</b><br>"
                 html += f"{self.tr('theo_max_score')}: {first_eval['theo_max_sub_score']:.2f} pts<br>"
                 
-                # Calculate average current sub score sum
-                total_current_sub = sum([e.get('current_sub_score', 0) for e in all_evaluations])
-                avg_current_sub = total_current_sub / calculated_count
+                # Average current sub score (accumulated during the batch loop)
+                avg_current_sub = total_scores.get("current_sub_score", 0.0) / calculated_count
                 html += f"Average {self.tr('current_sub_score')}: {avg_current_sub:.2f} pts<br>"
                 
                 ideal_str = ', '.join([self.tr(n) for n in first_eval.get('ideal_substats_list', [])])
@@ -33,6 +33,10 @@ DAMAGE_BONUS_STATS = [
     STAT_HAVOC_DMG_BONUS,
 ]
 
+# Placeholder used in character main-stat presets for "any element DMG bonus"
+STAT_ELEMENT_DMG_PLACEHOLDER = "属性ダメージアップ"
+DMG_BONUS_SUFFIX = "ダメージアップ"
+
 # --- CV Weight Keys ---
 CV_KEY_CRIT_RATE = "crit_rate"
 CV_KEY_CRIT_DMG = "crit_dmg"
@@ -92,6 +96,8 @@ DIR_TESSERACT = "tesseract"
 # --- Resource Path Keys (for get_resource_path) ---
 RES_GAME_DATA = "game_data.json"
 RES_CALC_CONFIG = "calculation_config.json"
+# Sidecar holding the parsed data files, stamped with their mtime and size
+DATA_CACHE_SUFFIX = ".pkl"
 
 # Default cost configuration
 DEFAULT_COST_CONFIG = "43311"
@@ -99,6 +105,18 @@ DEFAULT_COST_CONFIG = "43311"
 # OCR engine constants
 OCR_ENGINE_PILLOW = "pillow"
 
+# Upper bound on concurrent Tesseract processes during batch OCR
+OCR_BATCH_MAX_WORKERS = 4
+
+# Number of recent OCR texts kept per session, keyed by cropped-image hash
+OCR_CACHE_MAX_ENTRIES = 32
+
+# Number of crop-dialog preview pixmaps kept, keyed by source image and display size
+CROP_PREVIEW_CACHE_SIZE = 8
+
+# Longer side (px) above which crops are downscaled before Tesseract
+OCR_MAX_IMAGE_SIDE = 2400
+
 # JSON key constants for data structures
 KEY_SUBSTATS = "substats"
 KEY_STAT = "stat"
@@ -136,3 +154,4 @@ IMAGE_PREVIEW_MAX_HEIGHT = 260
 TIMER_SAVE_CONFIG_INTERVAL = 500
 TIMER_CROP_PREVIEW_INTERVAL = 100
 TIMER_RESIZE_PREVIEW_INTERVAL = 100
+TIMER_HISTORY_FILTER_INTERVAL = 250
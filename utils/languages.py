@@ -179,6 +179,8 @@ TRANSLATIONS = {
         "ocr_behavior": "OCR挙動設定",
         "skip_duplicate_ocr": "重複データを無視（入力スキップ）",
         "tooltip_skip_duplicate_ocr": "有効にすると、現在画面にあるデータと完全に一致するOCR結果を無視します。\n誤って同じ画像を再度OCRしてしまった場合に、手入力による修正などがリセットされるのを防ぎます。\n（履歴の保存設定とは独立して動作します）",
+        "ocr_downscale_large": "大きな画像を縮小してからOCR（高速化）",
+        "tooltip_ocr_downscale_large": "長辺が大きすぎる画像を縮小してからTesseractに渡します。\n高解像度のスクリーンショットでOCRが速くなります。",
         "crop_title": "画像切り取り",
         "crop_instruction": "マウスドラッグで切り取り範囲を指定してください。",
         "crop_sync_notice": "※ここで保存した位置(L,T)とサイズ(W,H)は、メイン画面のスライダー(％指定)と同期され、自動計算時に使用されます。",
@@ -548,6 +550,8 @@ TRANSLATIONS = {
         "ocr_behavior": "OCR Behavior",
         "skip_duplicate_ocr": "Ignore duplicate data (Skip input)",
         "tooltip_skip_duplicate_ocr": "If enabled, ignores OCR results that are identical to the current screen data.\nPrevents manual edits from being reset if you accidentally OCR the same image again.\n(Operates independently of History duplicate settings)",
+        "ocr_downscale_large": "Downscale large images before OCR (faster)",
+        "tooltip_ocr_downscale_large": "Shrinks images whose longer side is very large before passing them to Tesseract.\nSpeeds up OCR on high-resolution screenshots.",
         "crop_title": "Crop Image",
         "crop_instruction": "Drag mouse to select crop area.",
         "crop_sync_notice": "* The saved position (L,T) and size (W,H) will sync with the main UI sliders and be used for Auto Calculation.",
@@ -912,6 +916,8 @@ TRANSLATIONS = {
         "ocr_behavior": "OCR行为设置",
         "skip_duplicate_ocr": "忽略重复数据（跳过输入）",
         "tooltip_skip_duplicate_ocr": "启用后，将忽略与当前界面数据完全一致的OCR结果。\n防止意外再次OCR同一图像时导致的手动修改被重置。\n（独立于历史记录保存设置）",
+        "ocr_downscale_large": "OCR前缩小大尺寸图像（加速）",
+        "tooltip_ocr_downscale_large": "在交给Tesseract之前缩小长边过大的图像。\n可加快高分辨率截图的OCR速度。",
         "crop_title": "图像裁剪",
         "crop_instruction": "请通过鼠标拖拽指定裁剪范围。",
         "crop_sync_notice": "※此处保存的位置(L,T)和大小(W,H)将与主界面的滑块(%指定)同步，并用于自动计算。",
@@ -38,6 +38,20 @@ def get_resource_path(relative_path: str = "") -> str:
     return os.path.join(base_path, relative_path)
 
 
+def open_image(file_path: str) -> "Image.Image":
+    """Opens and fully decodes an image file, releasing the file handle before returning.
+
+    Args:
+        file_path: Path to the image file.
+
+    Returns:
+        The loaded Image object, no longer backed by the file.
+    """
+    with Image.open(file_path) as image:
+        image.load()
+    return image
+
+
 def crop_image_by_percent(
     img: "Image.Image", left_p: float, top_p: float, width_p: float, height_p: float
 ) -> "Image.Image":
@@ -93,6 +107,11 @@ def setup_tesseract():
         logger.warning("pytesseract is not installed. OCR functions will be unavailable.")
         return
 
+    # Batch OCR runs several Tesseract processes at once, and single-threaded ones
+    # overlap better. Set once here: os.environ is process-wide, so it must not be
+    # toggled while OCR threads may be spawning Tesseract.
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
     if sys.platform != "win32":
         logger.info("Tesseract setup is configured for Windows. On other OS, it's assumed to be in PATH.")
         return
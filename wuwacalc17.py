@@ -323,12 +323,29 @@ class ScoreCalculatorApp(QMainWindow):
         lbl = getattr(ui, "image_label", None)
 
         if not IS_PIL_INSTALLED or lbl is None or image is None:
+            self._last_image_preview = None
             if lbl:
                 lbl.setText(self.tr("no_image"))
                 lbl.setPixmap(QPixmap())
             return
 
-        qim = ImageQt.ImageQt(image)
+        # Resize events re-send the same image; reuse its pixmap
+        if self._last_image_preview is not None and self._last_image_preview[0] is image:
+            lbl.setPixmap(self._last_image_preview[1])
+            return
+
+        # Shrink in PIL first so only preview-sized pixels are converted to a QPixmap
+        preview = image
+        w, h = image.size
+        if w > IMAGE_PREVIEW_MAX_WIDTH or h > IMAGE_PREVIEW_MAX_HEIGHT:
+            scale = min(IMAGE_PREVIEW_MAX_WIDTH / w, IMAGE_PREVIEW_MAX_HEIGHT / h)
+            preview = image.resize(
+                (max(1, round(w * scale)), max(1, round(h * scale))),
+                Image.Resampling.BILINEAR,
+                reducing_gap=2.0,
+            )
+
+        qim = ImageQt.ImageQt(preview)
         pixmap = QPixmap.fromImage(qim)
         scaled = pixmap.scaled(
             IMAGE_PREVIEW_MAX_WIDTH,
@@ -336,6 +353,7 @@ class ScoreCalculatorApp(QMainWindow):
             Qt.AspectRatioMode.KeepAspectRatio,
             Qt.TransformationMode.SmoothTransformation,
         )
+        self._last_image_preview = (image, scaled)
         lbl.setPixmap(scaled)
 
     def _post_init_setup(self) -> None: